@@ -75,6 +75,28 @@ class ACLResourcePatternType(IntEnum):
     PREFIXED = 4
 
 
+class _EnumByValue(dict):
+    """Precomputed {value: member} table for an IntEnum.
+
+    Lookups of known values are a plain dict get; unknown values fall back
+    to the enum constructor so they still raise ValueError. Iterating the
+    enum skips aliases, so each value maps to the member Enum(value) returns.
+    """
+    def __init__(self, enum):
+        super(_EnumByValue, self).__init__((member.value, member) for member in enum)
+        self._enum = enum
+
+    def __missing__(self, value):
+        return self._enum(value)
+
+
+# {value: member} lookups for converting broker responses into enum members
+RESOURCE_TYPE_BY_VALUE = _EnumByValue(ResourceType)
+ACL_OPERATION_BY_VALUE = _EnumByValue(ACLOperation)
+ACL_PERMISSION_TYPE_BY_VALUE = _EnumByValue(ACLPermissionType)
+ACL_RESOURCE_PATTERN_TYPE_BY_VALUE = _EnumByValue(ACLResourcePatternType)
+
+
 class ACLFilter(object):
     """Represents a filter to use with describing and deleting ACLs
 
@@ -250,5 +272,19 @@ class ResourcePattern(ResourcePatternFilter):
             )
 
 
+# Operation values that only make sense in a filter, never as a granted operation
+_NON_CONCRETE_ACL_OPERATIONS = frozenset(
+    op.value for op in (ACLOperation.UNKNOWN, ACLOperation.ANY, ACLOperation.ALL))
+
+
 def valid_acl_operations(int_vals):
-     return set([ACLOperation(v) for v in int_vals if v not in (0, 1, 2)])
+    return set([ACL_OPERATION_BY_VALUE[v] for v in int_vals if v not in _NON_CONCRETE_ACL_OPERATIONS])
+
+
+def valid_acl_operation_names(int_vals):
+    """Return the names of the valid ACLOperations in int_vals.
+
+    Equivalent to [op.name for op in valid_acl_operations(int_vals)], but
+    without building an intermediate set.
+    """
+    return [ACL_OPERATION_BY_VALUE[v].name for v in int_vals if v not in _NON_CONCRETE_ACL_OPERATIONS]
@@ -1,17 +1,17 @@
 from __future__ import absolute_import, division
 
 from collections import defaultdict
-import copy
-import itertools
+from itertools import groupby
 import logging
+from operator import attrgetter
 import socket
 import time
 
 from . import ConfigResourceType
-from kafka.vendor import six
 
-from kafka.admin.acl_resource import ACLOperation, ACLPermissionType, ACLFilter, ACL, ResourcePattern, ResourceType, \
-    ACLResourcePatternType, valid_acl_operations
+from kafka.admin.acl_resource import ACLFilter, ACL, ResourcePattern, ACLResourcePatternType, \
+    ACL_OPERATION_BY_VALUE, ACL_PERMISSION_TYPE_BY_VALUE, ACL_RESOURCE_PATTERN_TYPE_BY_VALUE, RESOURCE_TYPE_BY_VALUE, \
+    valid_acl_operation_names
 from kafka.client_async import KafkaClient, selectors
 from kafka.coordinator.protocol import ConsumerProtocolMemberMetadata_v0, ConsumerProtocolMemberAssignment_v0, ConsumerProtocol_v0
 import kafka.errors as Errors
@@ -27,14 +27,30 @@ from kafka.protocol.admin import (
 from kafka.protocol.commit import OffsetFetchRequest
 from kafka.protocol.find_coordinator import FindCoordinatorRequest
 from kafka.protocol.metadata import MetadataRequest
-from kafka.protocol.types import Array
+from kafka.protocol.api import schema_to_object
+from kafka.protocol.types import Array, Schema
 from kafka.structs import TopicPartition, OffsetAndMetadata, MemberInformation, GroupInformation
+from kafka.util import Timer, WeakMethod
 from kafka.version import __version__
 
 
 log = logging.getLogger(__name__)
 
 
+# Convert an ACL (CreateAcls) or ACLFilter (DeleteAcls) into the request tuple
+# (resource_type, resource_name, [pattern_type,] principal, host, operation, permission_type)
+_acl_request_v0 = attrgetter(
+    'resource_pattern.resource_type', 'resource_pattern.resource_name',
+    'principal', 'host', 'operation', 'permission_type')
+_acl_request_v1 = attrgetter(
+    'resource_pattern.resource_type', 'resource_pattern.resource_name', 'resource_pattern.pattern_type',
+    'principal', 'host', 'operation', 'permission_type')
+# DescribeAcls filters share the same field layout, keyed by request version
+_acl_request_by_version = {0: _acl_request_v0, 1: _acl_request_v1}
+# Convert a NewPartitions into the CreatePartitions (total_count, [assignments]) tuple
+_create_partitions_request = attrgetter('total_count', 'new_assignments')
+
+
 class KafkaAdminClient(object):
     """A class for administering the Kafka cluster.
 
@@ -131,8 +147,11 @@ class KafkaAdminClient(object):
             timeout exception from the constructor when checking the broker
             api version. Only applies if api_version is None
         selector (selectors.BaseSelector): Provide a specific selector
-            implementation to use for I/O multiplexing.
-            Default: selectors.DefaultSelector
+            implementation to use for I/O multiplexing. The admin client only
+            ever holds a handful of broker sockets, for which poll(2) is
+            cheaper per call than epoll/kqueue.
+            Default: selectors.PollSelector where available, otherwise
+            selectors.DefaultSelector
         metrics (kafka.metrics.Metrics): Optionally provide a metrics
             instance for capturing network IO stats. Default: None.
         metric_group_prefix (str): Prefix for metric names. Default: ''
@@ -181,7 +200,7 @@ class KafkaAdminClient(object):
         'ssl_crlfile': None,
         'api_version': None,
         'api_version_auto_timeout_ms': 2000,
-        'selector': selectors.DefaultSelector,
+        'selector': getattr(selectors, 'PollSelector', selectors.DefaultSelector),
         'sasl_mechanism': None,
         'sasl_plain_username': None,
         'sasl_plain_password': None,
@@ -198,14 +217,19 @@ class KafkaAdminClient(object):
         'kafka_client': KafkaClient,
     }
 
+    # {response_class: name of its topic error field, or '' if it has none}
+    _controller_error_fields = {}
+    # {response_class: decoder} -- see _describe_groups_decoder()
+    _describe_groups_decoders = {}
+
     def __init__(self, **configs):
         log.debug("Starting KafkaAdminClient with configuration: %s", configs)
         extra_configs = set(configs).difference(self.DEFAULT_CONFIG)
         if extra_configs:
             raise KafkaConfigurationError("Unrecognized configs: {}".format(extra_configs))
 
-        self.config = copy.copy(self.DEFAULT_CONFIG)
-        self.config.update(configs)
+        # Single dict merge of defaults and overrides; DEFAULT_CONFIG is left untouched
+        self.config = dict(self.DEFAULT_CONFIG, **configs)
 
         # Configure metrics
         metrics_tags = {'client-id': self.config['client_id']}
@@ -224,6 +248,12 @@ class KafkaAdminClient(object):
         # Get auto-discovered version from client if necessary
         self.config['api_version'] = self._client.config['api_version']
 
+        # {(operation, max_version): version} -- see _api_version()
+        self._api_version_cache = {}
+        # {node_id: broker version tuple} of controllers already verified;
+        # cleared on metadata updates in case a broker was upgraded in place
+        self._node_version_cache = {}
+        self._client.cluster.add_listener(WeakMethod(self._handle_metadata_update))
         self._closed = False
         self._refresh_controller_id()
         log.debug("KafkaAdminClient started.")
@@ -234,6 +264,7 @@ class KafkaAdminClient(object):
             log.info("KafkaAdminClient already closed.")
             return
 
+        self._client.cluster.remove_listener(WeakMethod(self._handle_metadata_update))
         self._metrics.close()
         self._client.close()
         self._closed = True
@@ -250,9 +281,41 @@ class KafkaAdminClient(object):
         """
         return timeout_ms or self.config['request_timeout_ms']
 
+    def _handle_metadata_update(self, cluster):
+        # Brokers may have joined, left or been upgraded; renegotiate lazily
+        self._api_version_cache.clear()
+        self._node_version_cache.clear()
+
+    def _api_version(self, operation, max_version=None):
+        """Return the cached result of KafkaClient.api_version().
+
+        Negotiated broker api versions do not change while connections are
+        stable, so lookups are memoized per (operation, max_version). The
+        cache is reset on every cluster metadata update and whenever the
+        controller is refreshed.
+
+        Arguments:
+            operation: A list of protocol operation versions from kafka.protocol.
+
+        Keyword Arguments:
+            max_version (int, optional): Provide an alternate maximum api version
+                to reflect limitations in user code.
+
+        Returns:
+            int: The highest api version number compatible between client and broker.
+        """
+        key = (operation[0].API_KEY, max_version)
+        version = self._api_version_cache.get(key)
+        if version is None:
+            version = self._client.api_version(operation, max_version=max_version)
+            self._api_version_cache[key] = version
+        return version
+
     def _refresh_controller_id(self, timeout_ms=30000):
         """Determine the Kafka cluster controller."""
-        version = self._client.api_version(MetadataRequest, max_version=8)
+        # Broker versions may have changed along with the controller
+        self._api_version_cache.clear()
+        version = self._api_version(MetadataRequest, max_version=8)
         if version == 0:
             raise UnrecognizedBrokerVersion(
                 "Kafka Admin interface cannot determine the controller using MetadataRequest_v{}."
@@ -260,16 +323,24 @@ class KafkaAdminClient(object):
         # use defaults for allow_auto_topic_creation / include_authorized_operations in v6+
         request = MetadataRequest[version]()
 
-        timeout_at = time.time() + timeout_ms / 1000
-        while time.time() < timeout_at:
+        timer = Timer(timeout_ms)
+        # Back off exponentially from retry_backoff_ms, capped at 1 second,
+        # while waiting for a controller election to complete
+        backoff_ms = self.config['retry_backoff_ms']
+        while not timer.expired:
             response = self.send_request(request)
             controller_id = response.controller_id
             if controller_id == -1:
                 log.warning("Controller ID not available, got -1")
-                time.sleep(1)
+                time.sleep(min(backoff_ms, timer.timeout_ms) / 1000)
+                backoff_ms = min(backoff_ms * 2, 1000)
                 continue
-            # verify the controller is new enough to support our requests
-            controller_version = self._client.check_version(node_id=controller_id)
+            # verify the controller is new enough to support our requests;
+            # a node only needs to be probed the first time it is controller
+            controller_version = self._node_version_cache.get(controller_id)
+            if controller_version is None:
+                controller_version = self._client.check_version(node_id=controller_id)
+                self._node_version_cache[controller_id] = controller_version
             if controller_version < (0, 10, 0):
                 raise IncompatibleBrokerVersion(
                     "The controller appears to be running Kafka {}. KafkaAdminClient requires brokers >= 0.10.0.0."
@@ -289,7 +360,7 @@ class KafkaAdminClient(object):
         Returns:
             FindCoordinatorRequest
         """
-        version = self._client.api_version(FindCoordinatorRequest, max_version=2)
+        version = self._api_version(FindCoordinatorRequest, max_version=2)
         if version <= 0:
             request = FindCoordinatorRequest[version](group_id)
         elif version <= 2:
@@ -329,10 +400,56 @@ class KafkaAdminClient(object):
             A dict of {group_id: node_id} where node_id is the id of the
             broker that is the coordinator for the corresponding group.
         """
-        requests = [(self._find_coordinator_id_request(group_id), None) for group_id in group_ids]
-        coordinator_ids = self.send_requests(requests, response_fn=self._find_coordinator_id_process_response)
+        if self._api_version(FindCoordinatorRequest, max_version=4) >= 4:
+            return self._find_coordinator_ids_batch(group_ids)
+        # send_requests() resolves node ids into its own list, so feed it a
+        # generator rather than building an intermediate list here
+        coordinator_ids = self.send_requests(
+            ((self._find_coordinator_id_request(group_id), None) for group_id in group_ids),
+            response_fn=self._find_coordinator_id_process_response)
         return dict(zip(group_ids, coordinator_ids))
 
+    def _find_coordinator_ids_batch(self, group_ids):
+        """Find the broker node_ids of the coordinators of the given groups
+        with a single FindCoordinatorRequest.
+
+        Requires FindCoordinatorRequest >= v4 (KIP-699). Any errors are
+        immediately raised.
+
+        Arguments:
+            group_ids: A list of consumer group IDs. This is typically the group
+            name as a string.
+
+        Returns:
+            A dict of {group_id: node_id} where node_id is the id of the
+            broker that is the coordinator for the corresponding group.
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return {}
+        request = FindCoordinatorRequest[4](
+            coordinator_type=0,
+            coordinator_keys=group_ids,
+            tags={}
+        )
+        response = self.send_request(request)
+        coordinator_ids = {}
+        for key, node_id, _host, _port, error_code, _error_message, _tags in response.coordinators:
+            error_type = Errors.for_code(error_code)
+            if error_type is not Errors.NoError:
+                # Note: When error_type.retriable, Java will retry... see
+                # KafkaAdminClient's handleFindCoordinatorError method
+                raise error_type(
+                    "FindCoordinatorRequest failed for group '{}' with response '{}'."
+                    .format(key, response))
+            coordinator_ids[key] = node_id
+        missing = [group_id for group_id in group_ids if group_id not in coordinator_ids]
+        if missing:
+            raise Errors.CoordinatorNotAvailableError(
+                "FindCoordinatorResponse did not include the following groups: %s"
+                % ", ".join(missing))
+        return coordinator_ids
+
     def _send_request_to_node(self, node_id, request, wakeup=True):
         """Send a Kafka protocol message to a specific broker.
 
@@ -348,11 +465,26 @@ class KafkaAdminClient(object):
             A future object that may be polled for status and results.
         """
         try:
-            self._client.await_ready(node_id)
+            if not self._client.is_ready(node_id):
+                self._client.await_ready(node_id)
         except Errors.KafkaConnectionError as e:
             return Future().failure(e)
         return self._client.send(node_id, request, wakeup)
 
+    def _wait_for_future(self, future):
+        """Block until a single future completes. If it fails, raise its exception.
+
+        Arguments:
+            future: A Future object awaiting a result.
+
+        Raises:
+            The exception of the future if it fails.
+        """
+        while not future.is_done:
+            self._client.poll(future=future)
+        if future.failed():
+            raise future.exception  # pylint: disable-msg=raising-bad-type
+
     def _wait_for_futures(self, futures):
         """Block until all futures complete. If any fail, raise the encountered exception.
 
@@ -362,27 +494,50 @@ class KafkaAdminClient(object):
         Raises:
             The first encountered exception if a future fails.
         """
-        while not all(future.succeeded() for future in futures):
-            for future in futures:
-                self._client.poll(future=future)
-
+        pending = futures
+        while True:
+            still_pending = []
+            for future in pending:
                 if future.failed():
                     raise future.exception  # pylint: disable-msg=raising-bad-type
+                elif not future.is_done:
+                    still_pending.append(future)
+            if not still_pending:
+                return
+            pending = still_pending
+            # Without a specific future, poll() makes a single pass that
+            # blocks in the selector (up to request_timeout_ms) and services
+            # every socket that is ready, whichever futures they resolve.
+            self._client.poll()
 
     def send_request(self, request, node_id=None):
         if node_id is None:
             node_id = self._client.least_loaded_node()
-        self._client.await_ready(node_id)
+        # KafkaClient.send() fails immediately if the node is not connected,
+        # so only fall back to the (polling) await_ready() when needed
+        if not self._client.is_ready(node_id):
+            self._client.await_ready(node_id)
         future = self._client.send(node_id, request)
-        self._wait_for_futures([future]) # raises exception on failure
+        self._wait_for_future(future) # raises exception on failure
         return future.value
 
     def send_requests(self, requests_and_node_ids, response_fn=lambda x: x):
+        requests_and_node_ids = list(requests_and_node_ids)
+        # Initiate connections to every known node that is not ready before
+        # blocking on any of them, so that cold connections to several brokers
+        # are established concurrently rather than one after another.
+        node_ids = set(node_id for _, node_id in requests_and_node_ids
+                       if node_id is not None and not self._client.is_ready(node_id))
+        for node_id in node_ids:
+            self._client.maybe_connect(node_id)
         futures = []
         for request, node_id in requests_and_node_ids:
             if node_id is None:
+                # Resolved per request, after earlier requests are in flight,
+                # so that least_loaded_node() spreads them across brokers
                 node_id = self._client.least_loaded_node()
-            self._client.await_ready(node_id)
+            if not self._client.is_ready(node_id):
+                self._client.await_ready(node_id)
             futures.append(self._client.send(node_id, request))
         self._wait_for_futures(futures)
         return [response_fn(future.value) for future in futures]
@@ -408,8 +563,13 @@ class KafkaAdminClient(object):
             # So this is a little brittle in that it assumes all responses have
             # one of these attributes and that they always unpack into
             # (topic, error_code) tuples.
-            topic_error_tuples = getattr(response, 'topic_errors', getattr(response, 'topic_error_codes', None))
-            if topic_error_tuples is not None:
+            error_field = self._controller_error_fields.get(response.__class__)
+            if error_field is None:
+                error_field = next((name for name in ('topic_errors', 'topic_error_codes')
+                                    if hasattr(response, name)), '')
+                self._controller_error_fields[response.__class__] = error_field
+            if error_field:
+                topic_error_tuples = getattr(response, error_field)
                 success = self._parse_topic_request_response(topic_error_tuples, request, response, tries)
             else:
                 # Leader Election request has a two layer error response (topic and partition)
@@ -422,17 +582,19 @@ class KafkaAdminClient(object):
     def _parse_topic_request_response(self, topic_error_tuples, request, response, tries):
         # Also small py2/py3 compatibility -- py3 can ignore extra values
         # during unpack via: for x, y, *rest in list_of_values. py2 cannot.
-        # So for now we have to map across the list and explicitly drop any
-        # extra values (usually the error_message)
-        for topic, error_code in map(lambda e: e[:2], topic_error_tuples):
-            error_type = Errors.for_code(error_code)
-            if tries and error_type is Errors.NotControllerError:
+        # So index into each tuple, which ignores any extra values (usually
+        # the error_message) without allocating a sliced copy.
+        for_code, NoError, NotControllerError = Errors.for_code, Errors.NoError, Errors.NotControllerError
+        for topic_error in topic_error_tuples:
+            error_code = topic_error[1]
+            error_type = for_code(error_code)
+            if tries and error_type is NotControllerError:
                 # No need to inspect the rest of the errors for
                 # non-retriable errors because NotControllerError should
                 # either be thrown for all errors or no errors.
                 self._refresh_controller_id()
                 return False
-            elif error_type is not Errors.NoError:
+            elif error_type is not NoError:
                 raise error_type(
                     "Request '{}' failed with response '{}'."
                     .format(request, response))
@@ -441,18 +603,21 @@ class KafkaAdminClient(object):
     def _parse_topic_partition_request_response(self, request, response, tries):
         # Also small py2/py3 compatibility -- py3 can ignore extra values
         # during unpack via: for x, y, *rest in list_of_values. py2 cannot.
-        # So for now we have to map across the list and explicitly drop any
-        # extra values (usually the error_message)
+        # So index into each tuple, which ignores any extra values (usually
+        # the error_message) without allocating a sliced copy.
+        for_code, NotControllerError = Errors.for_code, Errors.NotControllerError
+        success_types = (Errors.NoError, Errors.ElectionNotNeededError)
         for topic, partition_results in response.replication_election_results:
-            for partition_id, error_code in map(lambda e: e[:2], partition_results):
-                error_type = Errors.for_code(error_code)
-                if tries and error_type is Errors.NotControllerError:
+            for partition_result in partition_results:
+                error_code = partition_result[1]
+                error_type = for_code(error_code)
+                if tries and error_type is NotControllerError:
                     # No need to inspect the rest of the errors for
                     # non-retriable errors because NotControllerError should
                     # either be thrown for all errors or no errors.
                     self._refresh_controller_id()
                     return False
-                elif error_type not in (Errors.NoError, Errors.ElectionNotNeededError):
+                elif error_type not in success_types:
                     raise error_type(
                         "Request '{}' failed with response '{}'."
                         .format(request, response))
@@ -476,12 +641,8 @@ class KafkaAdminClient(object):
             new_topic.name,
             new_topic.num_partitions,
             new_topic.replication_factor,
-            [
-                (partition_id, replicas) for partition_id, replicas in new_topic.replica_assignments.items()
-            ],
-            [
-                (config_key, config_value) for config_key, config_value in new_topic.topic_configs.items()
-            ]
+            list(new_topic.replica_assignments.items()),
+            list(new_topic.topic_configs.items())
         )
 
     def create_topics(self, new_topics, timeout_ms=None, validate_only=False):
@@ -499,7 +660,7 @@ class KafkaAdminClient(object):
         Returns:
             Appropriate version of CreateTopicResponse class.
         """
-        version = self._client.api_version(CreateTopicsRequest, max_version=3)
+        version = self._api_version(CreateTopicsRequest, max_version=3)
         timeout_ms = self._validate_timeout(timeout_ms)
         if version == 0:
             if validate_only:
@@ -533,7 +694,7 @@ class KafkaAdminClient(object):
         Returns:
             Appropriate version of DeleteTopicsResponse class.
         """
-        version = self._client.api_version(DeleteTopicsRequest, max_version=3)
+        version = self._api_version(DeleteTopicsRequest, max_version=3)
         timeout_ms = self._validate_timeout(timeout_ms)
         return self._send_request_to_controller(
             DeleteTopicsRequest[version](
@@ -542,20 +703,46 @@ class KafkaAdminClient(object):
             )
         )
 
-    def _process_metadata_response(self, metadata_response):
-        obj = metadata_response.to_object()
-        if 'authorized_operations' in obj:
-            obj['authorized_operations'] = list(map(lambda acl: acl.name, valid_acl_operations(obj['authorized_operations'])))
-        for t in obj['topics']:
-            if 'authorized_operations' in t:
-                t['authorized_operations'] = list(map(lambda acl: acl.name, valid_acl_operations(t['authorized_operations'])))
+    def _process_metadata_response(self, metadata_response, include_topics=True):
+        """Convert a MetadataResponse into a dict, decoding authorized_operations.
+
+        Fields are converted straight from the response struct in a single
+        pass. The topics array -- by far the largest part of the response for
+        big clusters -- is skipped entirely unless include_topics is set.
+        """
+        obj = {}
+        for name, field in zip(metadata_response.SCHEMA.names, metadata_response.SCHEMA.fields):
+            val = getattr(metadata_response, name)
+            if name == 'topics':
+                if not include_topics:
+                    continue
+                topics = []
+                for topic in val:
+                    t = schema_to_object(field.array_of, topic)
+                    if 'authorized_operations' in t:
+                        t['authorized_operations'] = valid_acl_operation_names(t['authorized_operations'])
+                    topics.append(t)
+                val = topics
+            elif name == 'authorized_operations':
+                val = valid_acl_operation_names(val)
+            elif isinstance(field, Array) and isinstance(field.array_of, Schema):
+                val = [schema_to_object(field.array_of, item) for item in val]
+            obj[name] = val
         return obj
 
     def _get_cluster_metadata(self, topics=None, auto_topic_creation=False):
         """
         topics == None means "get all topics"
         """
-        version = self._client.api_version(MetadataRequest, max_version=8)
+        return self._process_metadata_response(self._send_metadata_request(topics, auto_topic_creation))
+
+    def _send_metadata_request(self, topics=None, auto_topic_creation=False):
+        """
+        topics == None means "get all topics"
+
+        Returns the raw MetadataResponse.
+        """
+        version = self._api_version(MetadataRequest, max_version=8)
         if version <= 3:
             if auto_topic_creation:
                 raise IncompatibleBrokerVersion(
@@ -577,7 +764,7 @@ class KafkaAdminClient(object):
                 include_topic_authorized_operations=True,
             )
 
-        return self._process_metadata_response(self.send_request(request))
+        return self.send_request(request)
 
     def list_topics(self):
         """Retrieve a list of all topic names in the cluster.
@@ -585,8 +772,13 @@ class KafkaAdminClient(object):
         Returns:
             A list of topic name strings.
         """
-        metadata = self._get_cluster_metadata(topics=None)
-        return [t['topic'] for t in metadata['topics']]
+        response = self._send_metadata_request(topics=None)
+        # Read each topic's name by position rather than converting every
+        # partition to a dict; the position comes from the response schema
+        schema = response.SCHEMA
+        topic_names = schema.fields[schema.names.index('topics')].array_of.names
+        name_idx = topic_names.index('topic' if 'topic' in topic_names else 'name')
+        return [t[name_idx] for t in response.topics]
 
     def describe_topics(self, topics=None):
         """Fetch metadata for the specified topics or all topics if None.
@@ -610,9 +802,8 @@ class KafkaAdminClient(object):
         Returns:
             A dict with cluster-wide metadata, excluding topic details.
         """
-        metadata = self._get_cluster_metadata()
-        metadata.pop('topics')  # We have 'describe_topics' for this
-        return metadata
+        # We have 'describe_topics' for the topics
+        return self._process_metadata_response(self._send_metadata_request(), include_topics=False)
 
     @staticmethod
     def _convert_describe_acls_response_to_acls(describe_response):
@@ -627,30 +818,36 @@ class KafkaAdminClient(object):
         """
         version = describe_response.API_VERSION
 
+        # The layout is fixed for the whole response, so normalize it once up
+        # front instead of branching on version for every resource
+        if version == 0:
+            literal = ACLResourcePatternType.LITERAL.value
+            resources = [
+                (resource_type, resource_name, literal, acls)
+                for resource_type, resource_name, acls in describe_response.resources
+            ]
+        elif version <= 1:
+            resources = describe_response.resources
+        else:
+            raise NotImplementedError(
+                "Support for DescribeAcls Response v{} has not yet been added to KafkaAdmin."
+                    .format(version)
+            )
+
         error = Errors.for_code(describe_response.error_code)
         acl_list = []
-        for resources in describe_response.resources:
-            if version == 0:
-                resource_type, resource_name, acls = resources
-                resource_pattern_type = ACLResourcePatternType.LITERAL.value
-            elif version <= 1:
-                resource_type, resource_name, resource_pattern_type, acls = resources
-            else:
-                raise NotImplementedError(
-                    "Support for DescribeAcls Response v{} has not yet been added to KafkaAdmin."
-                        .format(version)
-                )
+        for resource_type, resource_name, resource_pattern_type, acls in resources:
             for acl in acls:
                 principal, host, operation, permission_type = acl
                 conv_acl = ACL(
                     principal=principal,
                     host=host,
-                    operation=ACLOperation(operation),
-                    permission_type=ACLPermissionType(permission_type),
+                    operation=ACL_OPERATION_BY_VALUE[operation],
+                    permission_type=ACL_PERMISSION_TYPE_BY_VALUE[permission_type],
                     resource_pattern=ResourcePattern(
-                        ResourceType(resource_type),
+                        RESOURCE_TYPE_BY_VALUE[resource_type],
                         resource_name,
-                        ACLResourcePatternType(resource_pattern_type)
+                        ACL_RESOURCE_PATTERN_TYPE_BY_VALUE[resource_pattern_type]
                     )
                 )
                 acl_list.append(conv_acl)
@@ -671,27 +868,8 @@ class KafkaAdminClient(object):
             tuple of a list of matching ACL objects and a KafkaError (NoError if successful)
         """
 
-        version = self._client.api_version(DescribeAclsRequest, max_version=1)
-        if version == 0:
-            request = DescribeAclsRequest[version](
-                resource_type=acl_filter.resource_pattern.resource_type,
-                resource_name=acl_filter.resource_pattern.resource_name,
-                principal=acl_filter.principal,
-                host=acl_filter.host,
-                operation=acl_filter.operation,
-                permission_type=acl_filter.permission_type
-            )
-        elif version <= 1:
-            request = DescribeAclsRequest[version](
-                resource_type=acl_filter.resource_pattern.resource_type,
-                resource_name=acl_filter.resource_pattern.resource_name,
-                resource_pattern_type_filter=acl_filter.resource_pattern.pattern_type,
-                principal=acl_filter.principal,
-                host=acl_filter.host,
-                operation=acl_filter.operation,
-                permission_type=acl_filter.permission_type
-
-            )
+        version = self._api_version(DescribeAclsRequest, max_version=1)
+        request = DescribeAclsRequest[version](*_acl_request_by_version[version](acl_filter))
         response = self.send_request(request)
         error_type = Errors.for_code(response.error_code)
         if error_type is not Errors.NoError:
@@ -702,46 +880,6 @@ class KafkaAdminClient(object):
 
         return self._convert_describe_acls_response_to_acls(response)
 
-    @staticmethod
-    def _convert_create_acls_resource_request_v0(acl):
-        """Convert an ACL object into the CreateAclsRequest v0 format.
-
-        Arguments:
-            acl: An ACL object with resource pattern and permissions.
-
-        Returns:
-            A tuple: (resource_type, resource_name, principal, host, operation, permission_type).
-        """
-
-        return (
-            acl.resource_pattern.resource_type,
-            acl.resource_pattern.resource_name,
-            acl.principal,
-            acl.host,
-            acl.operation,
-            acl.permission_type
-        )
-
-    @staticmethod
-    def _convert_create_acls_resource_request_v1(acl):
-        """Convert an ACL object into the CreateAclsRequest v1 format.
-
-        Arguments:
-            acl: An ACL object with resource pattern and permissions.
-
-        Returns:
-            A tuple: (resource_type, resource_name, pattern_type, principal, host, operation, permission_type).
-        """
-        return (
-            acl.resource_pattern.resource_type,
-            acl.resource_pattern.resource_name,
-            acl.resource_pattern.pattern_type,
-            acl.principal,
-            acl.host,
-            acl.operation,
-            acl.permission_type
-        )
-
     @staticmethod
     def _convert_create_acls_response_to_acls(acls, create_response):
         """Parse CreateAclsResponse and correlate success/failure with original ACL objects.
@@ -758,21 +896,24 @@ class KafkaAdminClient(object):
                  }
         """
         version = create_response.API_VERSION
+        if version > 1:
+            raise NotImplementedError(
+                "Support for DescribeAcls Response v{} has not yet been added to KafkaAdmin."
+                    .format(version)
+            )
+
+        # creation_responses correlate with acls by position, so they must pair up
+        if len(create_response.creation_responses) != len(acls):
+            raise Errors.KafkaProtocolError(
+                "CreateAclsResponse has {} creation results for {} requested ACLs."
+                .format(len(create_response.creation_responses), len(acls)))
 
+        for_code, NoError = Errors.for_code, Errors.NoError
         creations_error = []
         creations_success = []
-        for i, creations in enumerate(create_response.creation_responses):
-            if version <= 1:
-                error_code, error_message = creations
-                acl = acls[i]
-                error = Errors.for_code(error_code)
-            else:
-                raise NotImplementedError(
-                    "Support for DescribeAcls Response v{} has not yet been added to KafkaAdmin."
-                        .format(version)
-                )
-
-            if error is Errors.NoError:
+        for acl, (error_code, error_message) in zip(acls, create_response.creation_responses):
+            error = for_code(error_code)
+            if error is NoError:
                 creations_success.append(acl)
             else:
                 creations_error.append((acl, error,))
@@ -792,61 +933,21 @@ class KafkaAdminClient(object):
             dict of successes and failures
         """
 
-        for acl in acls:
-            if not isinstance(acl, ACL):
-                raise IllegalArgumentError("acls must contain ACL objects")
+        if not all(isinstance(acl, ACL) for acl in acls):
+            raise IllegalArgumentError("acls must contain ACL objects")
 
-        version = self._client.api_version(CreateAclsRequest, max_version=1)
+        version = self._api_version(CreateAclsRequest, max_version=1)
         if version == 0:
             request = CreateAclsRequest[version](
-                creations=[self._convert_create_acls_resource_request_v0(acl) for acl in acls]
+                creations=list(map(_acl_request_v0, acls))
             )
         elif version <= 1:
             request = CreateAclsRequest[version](
-                creations=[self._convert_create_acls_resource_request_v1(acl) for acl in acls]
+                creations=list(map(_acl_request_v1, acls))
             )
         response = self.send_request(request)
         return self._convert_create_acls_response_to_acls(acls, response)
 
-    @staticmethod
-    def _convert_delete_acls_resource_request_v0(acl):
-        """Convert an ACLFilter object into the DeleteAclsRequest v0 format.
-
-        Arguments:
-            acl: An ACLFilter object identifying the ACLs to be deleted.
-
-        Returns:
-            A tuple: (resource_type, resource_name, principal, host, operation, permission_type).
-        """
-        return (
-            acl.resource_pattern.resource_type,
-            acl.resource_pattern.resource_name,
-            acl.principal,
-            acl.host,
-            acl.operation,
-            acl.permission_type
-        )
-
-    @staticmethod
-    def _convert_delete_acls_resource_request_v1(acl):
-        """Convert an ACLFilter object into the DeleteAclsRequest v1 format.
-
-        Arguments:
-            acl: An ACLFilter object identifying the ACLs to be deleted.
-
-        Returns:
-            A tuple: (resource_type, resource_name, pattern_type, principal, host, operation, permission_type).
-        """
-        return (
-            acl.resource_pattern.resource_type,
-            acl.resource_pattern.resource_name,
-            acl.resource_pattern.pattern_type,
-            acl.principal,
-            acl.host,
-            acl.operation,
-            acl.permission_type
-        )
-
     @staticmethod
     def _convert_delete_acls_response_to_matching_acls(acl_filters, delete_response):
         """Parse the DeleteAclsResponse and map the results back to each input ACLFilter.
@@ -860,32 +961,36 @@ class KafkaAdminClient(object):
                  (acl_filter, [(matching_acl, KafkaError), ...], filter_level_error).
         """
         version = delete_response.API_VERSION
+        if version > 1:
+            raise NotImplementedError(
+                "Support for DescribeAcls Response v{} has not yet been added to KafkaAdmin."
+                    .format(version)
+            )
+        # v0 has no resource_pattern_type; it is always LITERAL
+        literal = ACLResourcePatternType.LITERAL.value if version == 0 else None
+
         filter_result_list = []
         for i, filter_responses in enumerate(delete_response.filter_responses):
             filter_error_code, filter_error_message, matching_acls = filter_responses
             filter_error = Errors.for_code(filter_error_code)
+            if literal is not None:
+                matching_acls = [
+                    (error_code, error_message, resource_type, resource_name, literal, principal, host, operation, permission_type)
+                    for error_code, error_message, resource_type, resource_name, principal, host, operation, permission_type in matching_acls
+                ]
             acl_result_list = []
             for acl in matching_acls:
-                if version == 0:
-                    error_code, error_message, resource_type, resource_name, principal, host, operation, permission_type = acl
-                    resource_pattern_type = ACLResourcePatternType.LITERAL.value
-                elif version == 1:
-                    error_code, error_message, resource_type, resource_name, resource_pattern_type, principal, host, operation, permission_type = acl
-                else:
-                    raise NotImplementedError(
-                        "Support for DescribeAcls Response v{} has not yet been added to KafkaAdmin."
-                            .format(version)
-                    )
+                error_code, error_message, resource_type, resource_name, resource_pattern_type, principal, host, operation, permission_type = acl
                 acl_error = Errors.for_code(error_code)
                 conv_acl = ACL(
                     principal=principal,
                     host=host,
-                    operation=ACLOperation(operation),
-                    permission_type=ACLPermissionType(permission_type),
+                    operation=ACL_OPERATION_BY_VALUE[operation],
+                    permission_type=ACL_PERMISSION_TYPE_BY_VALUE[permission_type],
                     resource_pattern=ResourcePattern(
-                        ResourceType(resource_type),
+                        RESOURCE_TYPE_BY_VALUE[resource_type],
                         resource_name,
-                        ACLResourcePatternType(resource_pattern_type)
+                        ACL_RESOURCE_PATTERN_TYPE_BY_VALUE[resource_pattern_type]
                     )
                 )
                 acl_result_list.append((conv_acl, acl_error,))
@@ -905,19 +1010,18 @@ class KafkaAdminClient(object):
                  The tuples hold (the input ACLFilter, list of affected ACLs, KafkaError instance)
         """
 
-        for acl in acl_filters:
-            if not isinstance(acl, ACLFilter):
-                raise IllegalArgumentError("acl_filters must contain ACLFilter type objects")
+        if not all(isinstance(acl, ACLFilter) for acl in acl_filters):
+            raise IllegalArgumentError("acl_filters must contain ACLFilter type objects")
 
-        version = self._client.api_version(DeleteAclsRequest, max_version=1)
+        version = self._api_version(DeleteAclsRequest, max_version=1)
 
         if version == 0:
             request = DeleteAclsRequest[version](
-                filters=[self._convert_delete_acls_resource_request_v0(acl) for acl in acl_filters]
+                filters=list(map(_acl_request_v0, acl_filters))
             )
         elif version <= 1:
             request = DeleteAclsRequest[version](
-                filters=[self._convert_delete_acls_resource_request_v1(acl) for acl in acl_filters]
+                filters=list(map(_acl_request_v1, acl_filters))
             )
         response = self.send_request(request)
         return self._convert_delete_acls_response_to_matching_acls(acl_filters, response)
@@ -935,9 +1039,7 @@ class KafkaAdminClient(object):
         return (
             config_resource.resource_type,
             config_resource.name,
-            [
-                config_key for config_key, config_value in config_resource.configs.items()
-            ] if config_resource.configs else None
+            list(config_resource.configs) if config_resource.configs else None
         )
 
     def describe_configs(self, config_resources, include_synonyms=False):
@@ -961,14 +1063,17 @@ class KafkaAdminClient(object):
         # All other (currently just topic resources) can be sent to any broker.
         broker_resources = []
         topic_resources = []
+        convert = self._convert_describe_config_resource_request
+        broker_type = ConfigResourceType.BROKER
 
         for config_resource in config_resources:
-            if config_resource.resource_type == ConfigResourceType.BROKER:
-                broker_resources.append(self._convert_describe_config_resource_request(config_resource))
+            resource = convert(config_resource)
+            if resource[0] == broker_type:
+                broker_resources.append(resource)
             else:
-                topic_resources.append(self._convert_describe_config_resource_request(config_resource))
+                topic_resources.append(resource)
 
-        version = self._client.api_version(DescribeConfigsRequest, max_version=2)
+        version = self._api_version(DescribeConfigsRequest, max_version=2)
         if include_synonyms and version == 0:
             raise IncompatibleBrokerVersion(
                 "include_synonyms requires DescribeConfigsRequest >= v1, which is not supported by Kafka {}."
@@ -1012,9 +1117,7 @@ class KafkaAdminClient(object):
         return (
             config_resource.resource_type,
             config_resource.name,
-            [
-                (config_key, config_value) for config_key, config_value in config_resource.configs.items()
-            ]
+            list(config_resource.configs.items())
         )
 
     def alter_configs(self, config_resources):
@@ -1032,9 +1135,9 @@ class KafkaAdminClient(object):
         Returns:
             Appropriate version of AlterConfigsResponse class.
         """
-        version = self._client.api_version(AlterConfigsRequest, max_version=1)
+        version = self._api_version(AlterConfigsRequest, max_version=1)
         request = AlterConfigsRequest[version](
-            resources=[self._convert_alter_config_resource_request(config_resource) for config_resource in config_resources]
+            resources=list(map(self._convert_alter_config_resource_request, config_resources))
         )
         # TODO the Java client has the note:
         # // We must make a separate AlterConfigs request for every BROKER resource we want to alter
@@ -1050,25 +1153,6 @@ class KafkaAdminClient(object):
     # describe log dirs protocol not yet implemented
     # Note: have to lookup the broker with the replica assignment and send the request to that broker
 
-    @staticmethod
-    def _convert_create_partitions_request(topic_name, new_partitions):
-        """Convert a NewPartitions object into the tuple format for CreatePartitionsRequest.
-
-        Arguments:
-            topic_name: The name of the existing topic.
-            new_partitions: A NewPartitions instance with total_count and new_assignments.
-
-        Returns:
-            A tuple: (topic_name, (total_count, [list_of_assignments])).
-        """
-        return (
-            topic_name,
-            (
-                new_partitions.total_count,
-                new_partitions.new_assignments
-            )
-        )
-
     def create_partitions(self, topic_partitions, timeout_ms=None, validate_only=False):
         """Create additional partitions for an existing topic.
 
@@ -1084,10 +1168,13 @@ class KafkaAdminClient(object):
         Returns:
             Appropriate version of CreatePartitionsResponse class.
         """
-        version = self._client.api_version(CreatePartitionsRequest, max_version=1)
+        version = self._api_version(CreatePartitionsRequest, max_version=1)
         timeout_ms = self._validate_timeout(timeout_ms)
         request = CreatePartitionsRequest[version](
-            topic_partitions=[self._convert_create_partitions_request(topic_name, new_partitions) for topic_name, new_partitions in topic_partitions.items()],
+            topic_partitions=[
+                (topic_name, _create_partitions_request(new_partitions))
+                for topic_name, new_partitions in topic_partitions.items()
+            ],
             timeout=timeout_ms,
             validate_only=validate_only
         )
@@ -1106,25 +1193,25 @@ class KafkaAdminClient(object):
         """
         timeout_ms = self._validate_timeout(timeout_ms)
 
-        partitions = set(partitions)
-        topics = set(tp.topic for tp in partitions)
+        # Index the requested partitions by (topic, partition); whatever is
+        # left over after matching against the metadata is unknown
+        wanted = {(tp.topic, tp.partition): tp for tp in partitions}
+        topics = {topic for topic, _ in wanted}
 
         metadata = self._get_cluster_metadata(topics=topics)
 
         leader2partitions = defaultdict(list)
-        valid_partitions = set()
         for topic in metadata.get("topics", ()):
+            topic_name = topic["topic"]
             for partition in topic.get("partitions", ()):
-                t2p = TopicPartition(topic=topic["topic"], partition=partition["partition"])
-                if t2p in partitions:
-                    leader2partitions[partition["leader"]].append(t2p)
-                    valid_partitions.add(t2p)
+                tp = wanted.pop((topic_name, partition["partition"]), None)
+                if tp is not None:
+                    leader2partitions[partition["leader"]].append(tp)
 
-        if len(partitions) != len(valid_partitions):
-            unknown = set(partitions) - valid_partitions
+        if wanted:
             raise UnknownTopicOrPartitionError(
                 "The following partitions are not known: %s"
-                % ", ".join(str(x) for x in unknown)
+                % ", ".join(str(x) for x in wanted.values())
             )
 
         return leader2partitions
@@ -1146,43 +1233,43 @@ class KafkaAdminClient(object):
         """
         timeout_ms = self._validate_timeout(timeout_ms)
         responses = []
-        version = self._client.api_version(DeleteRecordsRequest, max_version=0)
+        version = self._api_version(DeleteRecordsRequest, max_version=0)
 
         # We want to make as few requests as possible
         # If a single node serves as a partition leader for multiple partitions (and/or
         # topics), we can send all of those in a single request.
         # For that we store {leader -> {partitions for leader}}, and do 1 request per leader
+        # records_to_delete is a dict, so its keys are already unique
         if partition_leader_id is None:
             leader2partitions = self._get_leader_for_partitions(
-                set(records_to_delete), timeout_ms
+                records_to_delete, timeout_ms
             )
         else:
-            leader2partitions = {partition_leader_id: set(records_to_delete)}
+            leader2partitions = {partition_leader_id: list(records_to_delete)}
 
+        get_topic = attrgetter('topic')
         for leader, partitions in leader2partitions.items():
-            topic2partitions = defaultdict(list)
-            for partition in partitions:
-                topic2partitions[partition.topic].append(partition)
-
             request = DeleteRecordsRequest[version](
                 topics=[
-                    (topic, [(tp.partition, records_to_delete[tp]) for tp in partitions])
-                    for topic, partitions in topic2partitions.items()
+                    (topic, [(tp.partition, records_to_delete[tp]) for tp in topic_partitions])
+                    for topic, topic_partitions in groupby(sorted(partitions, key=get_topic), get_topic)
                 ],
                 timeout_ms=timeout_ms
             )
             response = self.send_request(request, node_id=leader)
             responses.append(response.to_object())
 
-        partition2result = {}
-        partition2error = {}
-        for response in responses:
-            for topic in response["topics"]:
-                for partition in topic["partitions"]:
-                    tp = TopicPartition(topic["name"], partition["partition_index"])
-                    partition2result[tp] = partition
-                    if partition["error_code"] != 0:
-                        partition2error[tp] = partition["error_code"]
+        partition2result = {
+            TopicPartition(topic["name"], partition["partition_index"]): partition
+            for response in responses
+            for topic in response["topics"]
+            for partition in topic["partitions"]
+        }
+        partition2error = {
+            tp: partition["error_code"]
+            for tp, partition in partition2result.items()
+            if partition["error_code"] != 0
+        }
 
         if partition2error:
             if len(partition2error) == 1:
@@ -1214,29 +1301,76 @@ class KafkaAdminClient(object):
     # describe delegation_token protocol not yet implemented
     # Note: send the request to the least_loaded_node()
 
-    def _describe_consumer_groups_request(self, group_id):
-        """Send a DescribeGroupsRequest to the group's coordinator.
+    def _describe_consumer_groups_request_factory(self):
+        """Build a function creating a DescribeGroupsRequest for one group.
 
-        Arguments:
-            group_id: The group name as a string
+        The version lookup and the version-specific arguments are resolved
+        once, so the factory can be applied to every group cheaply.
 
         Returns:
-            DescribeGroupsRequest object
+            A callable taking a group name and returning a DescribeGroupsRequest
+            object.
         """
-        version = self._client.api_version(DescribeGroupsRequest, max_version=3)
+        version = self._api_version(DescribeGroupsRequest, max_version=3)
+        request_type = DescribeGroupsRequest[version]
+        # Note: KAFKA-6788 A potential optimization is to group the
+        # request per coordinator and send one request with a list of
+        # all consumer groups. Java still hasn't implemented this
+        # because the error checking is hard to get right when some
+        # groups error and others don't.
         if version <= 2:
-            # Note: KAFKA-6788 A potential optimization is to group the
-            # request per coordinator and send one request with a list of
-            # all consumer groups. Java still hasn't implemented this
-            # because the error checking is hard to get right when some
-            # groups error and others don't.
-            request = DescribeGroupsRequest[version](groups=(group_id,))
+            return lambda group_id: request_type(groups=(group_id,))
+        return lambda group_id: request_type(
+            groups=(group_id,),
+            include_authorized_operations=True
+        )
+
+    @staticmethod
+    def _describe_groups_decoder(response_type):
+        """Build a function converting one described group of response_type
+        into a GroupInformation.
+
+        The response schema is inspected once, here; the returned decoder only
+        does positional access on the decoded group and member tuples.
+        """
+        schema = response_type.SCHEMA
+        group_schema = schema.fields[schema.names.index('groups')].array_of
+        member_schema = group_schema.fields[group_schema.names.index('members')].array_of
+        protocol_type_idx = group_schema.names.index('protocol_type')
+        members_idx = group_schema.names.index('members')
+        metadata_idx = member_schema.names.index('member_metadata')
+        assignment_idx = member_schema.names.index('member_assignment')
+        # Version 3 of the DescribeGroups API introduced the "authorized_operations" field.
+        if 'authorized_operations' in group_schema.names:
+            authorized_operations_idx = group_schema.names.index('authorized_operations')
         else:
-            request = DescribeGroupsRequest[version](
-                groups=(group_id,),
-                include_authorized_operations=True
-            )
-        return request
+            authorized_operations_idx = None
+        consumer_protocol_type = ConsumerProtocol_v0.PROTOCOL_TYPE
+
+        def decode(described_group):
+            group_information = list(described_group)
+            protocol_type = group_information[protocol_type_idx]
+            members = []
+            if not protocol_type or protocol_type == consumer_protocol_type:
+                for member in group_information[members_idx]:
+                    member = list(member)
+                    if member[metadata_idx]:
+                        member[metadata_idx] = ConsumerProtocolMemberMetadata_v0.decode(member[metadata_idx])
+                    if member[assignment_idx]:
+                        member[assignment_idx] = ConsumerProtocolMemberAssignment_v0.decode(member[assignment_idx])
+                    members.append(MemberInformation._make(member))
+            else:
+                for member in group_information[members_idx]:
+                    members.append(MemberInformation._make(member))
+            group_information[members_idx] = members
+            if authorized_operations_idx is not None:
+                group_information[authorized_operations_idx] = valid_acl_operation_names(
+                    group_information[authorized_operations_idx])
+            else:
+                # TODO: Fix GroupInformation defaults
+                group_information.append([])
+            return GroupInformation._make(group_information)
+        return decode
 
     def _describe_consumer_groups_process_response(self, response):
         """Process a DescribeGroupsResponse into a group description."""
@@ -1246,41 +1380,11 @@ class KafkaAdminClient(object):
                 .format(response.API_VERSION))
 
         assert len(response.groups) == 1
-        for response_field, response_name in zip(response.SCHEMA.fields, response.SCHEMA.names):
-            if isinstance(response_field, Array):
-                described_groups_field_schema = response_field.array_of
-                described_group = getattr(response, response_name)[0]
-                described_group_information_list = []
-                protocol_type_is_consumer = False
-                for (described_group_information, group_information_name, group_information_field) in zip(described_group, described_groups_field_schema.names, described_groups_field_schema.fields):
-                    if group_information_name == 'protocol_type':
-                        protocol_type = described_group_information
-                        protocol_type_is_consumer = (protocol_type == ConsumerProtocol_v0.PROTOCOL_TYPE or not protocol_type)
-                    if isinstance(group_information_field, Array):
-                        member_information_list = []
-                        member_schema = group_information_field.array_of
-                        for members in described_group_information:
-                            member_information = []
-                            for (member, member_field, member_name)  in zip(members, member_schema.fields, member_schema.names):
-                                if protocol_type_is_consumer:
-                                    if member_name == 'member_metadata' and member:
-                                        member_information.append(ConsumerProtocolMemberMetadata_v0.decode(member))
-                                    elif member_name == 'member_assignment' and member:
-                                        member_information.append(ConsumerProtocolMemberAssignment_v0.decode(member))
-                                    else:
-                                        member_information.append(member)
-                            member_info_tuple = MemberInformation._make(member_information)
-                            member_information_list.append(member_info_tuple)
-                        described_group_information_list.append(member_information_list)
-                    else:
-                        described_group_information_list.append(described_group_information)
-                # Version 3 of the DescribeGroups API introduced the "authorized_operations" field.
-                if response.API_VERSION >= 3:
-                    described_group_information_list[-1] = list(map(lambda acl: acl.name, valid_acl_operations(described_group_information_list[-1])))
-                else:
-                    # TODO: Fix GroupInformation defaults
-                    described_group_information_list.append([])
-                group_description = GroupInformation._make(described_group_information_list)
+        decoder = self._describe_groups_decoders.get(response.__class__)
+        if decoder is None:
+            decoder = self._describe_groups_decoder(response.__class__)
+            self._describe_groups_decoders[response.__class__] = decoder
+        group_description = decoder(response.groups[0])
         error_code = group_description.error_code
         error_type = Errors.for_code(error_code)
         # Java has the note: KAFKA-6789, we can retry based on the error code
@@ -1318,8 +1422,9 @@ class KafkaAdminClient(object):
         else:
             groups_coordinators = self._find_coordinator_ids(group_ids)
 
+        request_factory = self._describe_consumer_groups_request_factory()
         requests = [
-            (self._describe_consumer_groups_request(group_id), coordinator_id)
+            (request_factory(group_id), coordinator_id)
             for group_id, coordinator_id in groups_coordinators.items()
         ]
         return self.send_requests(requests, response_fn=self._describe_consumer_groups_process_response)
@@ -1330,14 +1435,14 @@ class KafkaAdminClient(object):
         Returns:
             ListGroupsRequest object
         """
-        version = self._client.api_version(ListGroupsRequest, max_version=2)
+        version = self._api_version(ListGroupsRequest, max_version=2)
         return ListGroupsRequest[version]()
 
     def _list_consumer_groups_process_response(self, response):
         """Process a ListGroupsResponse into a list of groups."""
         if response.API_VERSION <= 2:
-            error_type = Errors.for_code(response.error_code)
-            if error_type is not Errors.NoError:
+            if response.error_code != 0:
+                error_type = Errors.for_code(response.error_code)
                 raise error_type(
                     "ListGroupsRequest failed with response '{}'."
                     .format(response))
@@ -1387,8 +1492,10 @@ class KafkaAdminClient(object):
             (self._list_consumer_groups_request(), broker_id)
             for broker_id in broker_ids
         ]
-        consumer_groups = self.send_requests(requests, response_fn=self._list_consumer_groups_process_response)
-        return list(set().union(*consumer_groups))
+        consumer_groups = set()
+        for groups in self.send_requests(requests, response_fn=self._list_consumer_groups_process_response):
+            consumer_groups.update(groups)
+        return list(consumer_groups)
 
     def _list_consumer_group_offsets_request(self, group_id, partitions=None):
         """Send an OffsetFetchRequest to a broker.
@@ -1404,7 +1511,7 @@ class KafkaAdminClient(object):
         Returns:
             OffsetFetchRequest object
         """
-        version = self._client.api_version(OffsetFetchRequest, max_version=5)
+        version = self._api_version(OffsetFetchRequest, max_version=5)
         if partitions is None:
             if version <= 1:
                 raise ValueError(
@@ -1415,10 +1522,14 @@ class KafkaAdminClient(object):
             topics_partitions = None
         else:
             # transform from [TopicPartition("t1", 1), TopicPartition("t1", 2)] to [("t1", [1, 2])]
-            topics_partitions_dict = defaultdict(set)
+            topics_partitions_dict = defaultdict(list)
             for topic, partition in partitions:
-                topics_partitions_dict[topic].add(partition)
-            topics_partitions = list(six.iteritems(topics_partitions_dict))
+                topics_partitions_dict[topic].append(partition)
+            # drop duplicate partitions so each is requested only once
+            topics_partitions = [
+                (topic, list(dict.fromkeys(topic_partitions)))
+                for topic, topic_partitions in topics_partitions_dict.items()
+            ]
         return OffsetFetchRequest[version](group_id, topics_partitions)
 
     def _list_consumer_group_offsets_process_response(self, response):
@@ -1434,26 +1545,26 @@ class KafkaAdminClient(object):
         if response.API_VERSION <= 5:
 
             # OffsetFetchResponse_v1 lacks a top-level error_code
-            if response.API_VERSION > 1:
+            if response.API_VERSION > 1 and response.error_code != 0:
                 error_type = Errors.for_code(response.error_code)
-                if error_type is not Errors.NoError:
-                    # optionally we could retry if error_type.retriable
-                    raise error_type(
-                        "OffsetFetchResponse failed with response '{}'."
-                        .format(response))
+                # optionally we could retry if error_type.retriable
+                raise error_type(
+                    "OffsetFetchResponse failed with response '{}'."
+                    .format(response))
 
             # transform response into a dictionary with TopicPartition keys and
             # OffsetAndMetadata values--this is what the Java AdminClient returns
             offsets = {}
+            has_leader_epoch = response.API_VERSION > 4
             for topic, partitions in response.topics:
                 for partition_data in partitions:
-                    if response.API_VERSION <= 4:
+                    if has_leader_epoch:
+                        partition, offset, leader_epoch, metadata, error_code = partition_data
+                    else:
                         partition, offset, metadata, error_code = partition_data
                         leader_epoch = -1
-                    else:
-                        partition, offset, leader_epoch, metadata, error_code = partition_data
-                    error_type = Errors.for_code(error_code)
-                    if error_type is not Errors.NoError:
+                    if error_code != 0:
+                        error_type = Errors.for_code(error_code)
                         raise error_type(
                             "Unable to fetch consumer group offsets for topic {}, partition {}"
                             .format(topic, partition))
@@ -1501,6 +1612,51 @@ class KafkaAdminClient(object):
         response = self.send_request(request, node_id=group_coordinator_id)
         return self._list_consumer_group_offsets_process_response(response)
 
+    def list_consumer_group_offsets_batch(self, group_ids, group_coordinator_id=None,
+                                          partitions=None):
+        """Fetch Consumer Offsets for several consumer groups at once.
+
+        The group coordinators are looked up together and the OffsetFetch
+        requests for all groups are sent concurrently, so fetching offsets for
+        many groups costs about as many round trips as fetching them for one.
+
+        Note:
+        This does not verify that the group_ids or partitions actually exist
+        in the cluster.
+
+        As soon as any error is encountered, it is immediately raised.
+
+        Arguments:
+            group_ids ([str]): The consumer group id names for which to fetch offsets.
+
+        Keyword Arguments:
+            group_coordinator_id (int, optional): The node_id of the groups'
+                coordinator broker. Use only if all groups are coordinated by
+                the same broker. If set to None, will query the cluster to find
+                the coordinator of every group. Default: None.
+            partitions: A list of TopicPartitions for which to fetch
+                offsets, applied to every group. On brokers >= 0.10.2, this can
+                be set to None to fetch all known offsets for each consumer
+                group. Default: None.
+
+        Returns:
+            dictionary: A dictionary with group_id keys. Each value is a
+            dictionary with TopicPartition keys and OffsetAndMetadata values,
+            as returned by list_consumer_group_offsets.
+        """
+        if group_coordinator_id is not None:
+            groups_coordinators = {group_id: group_coordinator_id for group_id in group_ids}
+        else:
+            groups_coordinators = self._find_coordinator_ids(group_ids)
+
+        group_ids = list(groups_coordinators)
+        requests = [
+            (self._list_consumer_group_offsets_request(group_id, partitions), groups_coordinators[group_id])
+            for group_id in group_ids
+        ]
+        results = self.send_requests(requests, response_fn=self._list_consumer_group_offsets_process_response)
+        return dict(zip(group_ids, results))
+
     def delete_consumer_groups(self, group_ids, group_coordinator_id=None):
         """Delete Consumer Group Offsets for given consumer groups.
 
@@ -1537,7 +1693,7 @@ class KafkaAdminClient(object):
         ]
 
         results = self.send_requests(requests, response_fn=self._convert_delete_groups_response)
-        return list(itertools.chain(*results))
+        return [group_result for group_results in results for group_result in group_results]
 
     def _convert_delete_groups_response(self, response):
         """Parse the DeleteGroupsResponse, mapping group IDs to their respective errors.
@@ -1549,10 +1705,11 @@ class KafkaAdminClient(object):
             A list of (group_id, KafkaError) for each deleted group.
         """
         if response.API_VERSION <= 1:
-            results = []
-            for group_id, error_code in response.results:
-                results.append((group_id, Errors.for_code(error_code)))
-            return results
+            no_error = Errors.NoError
+            return [
+                (group_id, no_error if error_code == 0 else Errors.for_code(error_code))
+                for group_id, error_code in response.results
+            ]
         else:
             raise NotImplementedError(
                 "Support for DeleteGroupsResponse_v{} has not yet been added to KafkaAdminClient."
@@ -1567,7 +1724,7 @@ class KafkaAdminClient(object):
         Returns:
             A DeleteGroupsRequest object.
         """
-        version = self._client.api_version(DeleteGroupsRequest, max_version=1)
+        version = self._api_version(DeleteGroupsRequest, max_version=1)
         return DeleteGroupsRequest[version](group_ids)
 
     @staticmethod
@@ -1581,11 +1738,11 @@ class KafkaAdminClient(object):
         ]
 
     def _get_all_topic_partitions(self):
+        # _partitions maps topic -> {partition: PartitionMetadata}, so the
+        # keys are already the partition ids
+        partitions = self._client.cluster._partitions
         return [
-            (
-                topic,
-                [partition_info.partition for partition_info in self._client.cluster._partitions[topic].values()]
-            )
+            (topic, list(partitions[topic]))
             for topic in self._client.cluster.topics()
         ]
 
@@ -1605,7 +1762,7 @@ class KafkaAdminClient(object):
 
         :return: Appropriate version of ElectLeadersResponse class.
         """
-        version = self._client.api_version(ElectLeadersRequest, max_version=1)
+        version = self._api_version(ElectLeadersRequest, max_version=1)
         timeout_ms = self._validate_timeout(timeout_ms)
         request = ElectLeadersRequest[version](
             election_type=ElectionType(election_type),
@@ -1621,5 +1778,5 @@ class KafkaAdminClient(object):
         Returns:
             DescribeLogDirsResponse object
         """
-        version = self._client.api_version(DescribeLogDirsRequest, max_version=0)
+        version = self._api_version(DescribeLogDirsRequest, max_version=0)
         return self.send_request(DescribeLogDirsRequest[version]())
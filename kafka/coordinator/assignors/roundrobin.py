@@ -1,14 +1,10 @@
 from __future__ import absolute_import
 
 import collections
-import itertools
 import logging
 
-from kafka.vendor import six
-
 from kafka.coordinator.assignors.abstract import AbstractPartitionAssignor
 from kafka.coordinator.protocol import ConsumerProtocolMemberMetadata_v0, ConsumerProtocolMemberAssignment_v0
-from kafka.structs import TopicPartition
 
 log = logging.getLogger(__name__)
 
@@ -50,39 +46,76 @@ class RoundRobinPartitionAssignor(AbstractPartitionAssignor):
 
     @classmethod
     def assign(cls, cluster, group_subscriptions):
+        member_topics = {
+            member_id: frozenset(subscription.topics)
+            for member_id, subscription in group_subscriptions.items()
+        }
         all_topics = set()
-        for subscription in six.itervalues(group_subscriptions):
-            all_topics.update(subscription.topics)
+        for topics in member_topics.values():
+            all_topics.update(topics)
 
+        # Walking topics and then each topic's partitions in sorted order
+        # yields the partitions already sorted by (topic, partition)
         all_topic_partitions = []
-        for topic in all_topics:
+        for topic in sorted(all_topics):
             partitions = cluster.partitions_for_topic(topic)
             if partitions is None:
                 log.warning('No partition metadata for topic %s', topic)
                 continue
-            for partition in partitions:
-                all_topic_partitions.append(TopicPartition(topic, partition))
-        all_topic_partitions.sort()
+            for partition in sorted(partitions):
+                all_topic_partitions.append((topic, partition))
 
         # construct {member_id: {topic: [partition, ...]}}
-        assignment = collections.defaultdict(lambda: collections.defaultdict(list))
+        assignment = {member_id: collections.defaultdict(list) for member_id in group_subscriptions}
 
         # Sort static and dynamic members separately to maintain stable static assignments
-        ungrouped = [(subscription.group_instance_id, member_id) for member_id, subscription in six.iteritems(group_subscriptions)]
-        grouped = {k: list(g) for k, g in itertools.groupby(ungrouped, key=lambda ids: ids[0] is not None)}
-        member_list = sorted(grouped.get(True, [])) + sorted(grouped.get(False, [])) # sorted static members first, then sorted dynamic
-        member_iter = itertools.cycle(member_list)
-
-        for partition in all_topic_partitions:
-            _group_instance_id, member_id = next(member_iter)
+        static_members = []
+        dynamic_members = []
+        for member_id, subscription in group_subscriptions.items():
+            if subscription.group_instance_id is not None:
+                static_members.append((subscription.group_instance_id, member_id))
+            else:
+                dynamic_members.append((subscription.group_instance_id, member_id))
+        member_list = sorted(static_members) + sorted(dynamic_members) # sorted static members first, then sorted dynamic
+        num_members = len(member_list)
+
+        first_topics = next(iter(member_topics.values()), None)
+        if all(topics == first_topics for topics in member_topics.values()):
+            # Identical subscriptions: every member takes every topic, so no
+            # member is ever skipped and a plain rotation is enough
+            for index, (topic, partition) in enumerate(all_topic_partitions):
+                member_id = member_list[index % num_members][1]
+                assignment[member_id][topic].append(partition)
+        else:
+            # For every topic precompute, for each position in member_list,
+            # the position of the first member at or after it (wrapping
+            # around) that is subscribed to the topic. This replaces stepping
+            # through unsubscribed members one at a time for every partition,
+            # while keeping the single shared round robin position across
+            # topics.
+            position_topics = [member_topics[member_id] for _, member_id in member_list]
+            next_subscriber = {}
+            for topic in all_topics:
+                table = [None] * num_members
+                following = None
+                for _ in range(2):
+                    for position in range(num_members - 1, -1, -1):
+                        if topic in position_topics[position]:
+                            following = position
+                        table[position] = following
+                next_subscriber[topic] = table
 
             # Because we constructed all_topic_partitions from the set of
-            # member subscribed topics, we should be safe assuming that
-            # each topic in all_topic_partitions is in at least one member
-            # subscription; otherwise this could yield an infinite loop
-            while partition.topic not in group_subscriptions[member_id].topics:
-                member_id = next(member_iter)
-            assignment[member_id][partition.topic].append(partition.partition)
+            # member subscribed topics, each topic in all_topic_partitions is
+            # in at least one member subscription, so every table entry is set
+            position = 0
+            for topic, partition in all_topic_partitions:
+                position = next_subscriber[topic][position]
+                member_id = member_list[position][1]
+                assignment[member_id][topic].append(partition)
+                position += 1
+                if position == num_members:
+                    position = 0
 
         protocol_assignment = {}
         for member_id in group_subscriptions:
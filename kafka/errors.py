@@ -1055,8 +1055,9 @@ kafka_errors = dict([(x.errno, x) for x in _iter_broker_errors()])
 
 
 def for_code(error_code):
-    if error_code in kafka_errors:
-        return kafka_errors[error_code]
+    error_type = kafka_errors.get(error_code)
+    if error_type is not None:
+        return error_type
     else:
         # The broker error code was not found in our list. This can happen when connecting
         # to a newer broker (with new error codes), or simply because our error list is
@@ -49,21 +49,25 @@ class CreateTopicsResponse_v3(Response):
     SCHEMA = CreateTopicsResponse_v2.SCHEMA
 
 
+# Topic entries are unchanged across CreateTopicsRequest v0-v3
+_CREATE_TOPIC_REQUESTS = Array(
+    ('topic', String('utf-8')),
+    ('num_partitions', Int32),
+    ('replication_factor', Int16),
+    ('replica_assignment', Array(
+        ('partition_id', Int32),
+        ('replicas', Array(Int32)))),
+    ('configs', Array(
+        ('config_key', String('utf-8')),
+        ('config_value', String('utf-8')))))
+
+
 class CreateTopicsRequest_v0(Request):
     API_KEY = 19
     API_VERSION = 0
     RESPONSE_TYPE = CreateTopicsResponse_v0
     SCHEMA = Schema(
-        ('create_topic_requests', Array(
-            ('topic', String('utf-8')),
-            ('num_partitions', Int32),
-            ('replication_factor', Int16),
-            ('replica_assignment', Array(
-                ('partition_id', Int32),
-                ('replicas', Array(Int32)))),
-            ('configs', Array(
-                ('config_key', String('utf-8')),
-                ('config_value', String('utf-8')))))),
+        ('create_topic_requests', _CREATE_TOPIC_REQUESTS),
         ('timeout', Int32)
     )
 
@@ -73,16 +77,7 @@ class CreateTopicsRequest_v1(Request):
     API_VERSION = 1
     RESPONSE_TYPE = CreateTopicsResponse_v1
     SCHEMA = Schema(
-        ('create_topic_requests', Array(
-            ('topic', String('utf-8')),
-            ('num_partitions', Int32),
-            ('replication_factor', Int16),
-            ('replica_assignment', Array(
-                ('partition_id', Int32),
-                ('replicas', Array(Int32)))),
-            ('configs', Array(
-                ('config_key', String('utf-8')),
-                ('config_value', String('utf-8')))))),
+        ('create_topic_requests', _CREATE_TOPIC_REQUESTS),
         ('timeout', Int32),
         ('validate_only', Boolean)
     )
@@ -276,6 +271,15 @@ ListGroupsResponse = [
 ]
 
 
+# Member entries are unchanged across DescribeGroupsResponse v0-v3
+_DESCRIBE_GROUPS_MEMBERS = Array(
+    ('member_id', String('utf-8')),
+    ('client_id', String('utf-8')),
+    ('client_host', String('utf-8')),
+    ('member_metadata', Bytes),
+    ('member_assignment', Bytes))
+
+
 class DescribeGroupsResponse_v0(Response):
     API_KEY = 15
     API_VERSION = 0
@@ -286,12 +290,7 @@ class DescribeGroupsResponse_v0(Response):
             ('state', String('utf-8')),
             ('protocol_type', String('utf-8')),
             ('protocol', String('utf-8')),
-            ('members', Array(
-                ('member_id', String('utf-8')),
-                ('client_id', String('utf-8')),
-                ('client_host', String('utf-8')),
-                ('member_metadata', Bytes),
-                ('member_assignment', Bytes)))))
+            ('members', _DESCRIBE_GROUPS_MEMBERS)))
     )
 
 
@@ -306,12 +305,7 @@ class DescribeGroupsResponse_v1(Response):
             ('state', String('utf-8')),
             ('protocol_type', String('utf-8')),
             ('protocol', String('utf-8')),
-            ('members', Array(
-                ('member_id', String('utf-8')),
-                ('client_id', String('utf-8')),
-                ('client_host', String('utf-8')),
-                ('member_metadata', Bytes),
-                ('member_assignment', Bytes)))))
+            ('members', _DESCRIBE_GROUPS_MEMBERS)))
     )
 
 
@@ -332,12 +326,7 @@ class DescribeGroupsResponse_v3(Response):
             ('state', String('utf-8')),
             ('protocol_type', String('utf-8')),
             ('protocol', String('utf-8')),
-            ('members', Array(
-                ('member_id', String('utf-8')),
-                ('client_id', String('utf-8')),
-                ('client_host', String('utf-8')),
-                ('member_metadata', Bytes),
-                ('member_assignment', Bytes))),
+            ('members', _DESCRIBE_GROUPS_MEMBERS),
             ('authorized_operations', BitField)))
     )
 
@@ -674,24 +663,7 @@ class DescribeConfigsResponse_v1(Response):
 class DescribeConfigsResponse_v2(Response):
     API_KEY = 32
     API_VERSION = 2
-    SCHEMA = Schema(
-        ('throttle_time_ms', Int32),
-        ('resources', Array(
-            ('error_code', Int16),
-            ('error_message', String('utf-8')),
-            ('resource_type', Int8),
-            ('resource_name', String('utf-8')),
-            ('config_entries', Array(
-                ('config_names', String('utf-8')),
-                ('config_value', String('utf-8')),
-                ('read_only', Boolean),
-                ('config_source', Int8),
-                ('is_sensitive', Boolean),
-                ('config_synonyms', Array(
-                    ('config_name', String('utf-8')),
-                    ('config_value', String('utf-8')),
-                    ('config_source', Int8)))))))
-    )
+    SCHEMA = DescribeConfigsResponse_v1.SCHEMA
 
 class DescribeConfigsRequest_v0(Request):
     API_KEY = 32
@@ -1107,7 +1079,7 @@ class ElectionType(IntEnum):
     """ Leader election type
     """
 
-    PREFERRED = 0,
+    PREFERRED = 0
     UNCLEAN = 1
 
 
@@ -80,13 +80,29 @@ class Request(Struct):
         return True
 
     def to_object(self):
-        return _to_object(self.SCHEMA, self)
+        return schema_to_object(self.SCHEMA, self)
 
     def build_header(self, correlation_id, client_id):
         if self.FLEXIBLE_VERSION:
             return RequestHeaderV2(self, correlation_id=correlation_id, client_id=client_id)
         return RequestHeader(self, correlation_id=correlation_id, client_id=client_id)
 
+    # (request class, client_id) -> encoded header bytes before and after
+    # the correlation_id, which is the only field that changes per request.
+    # Never evicted: this assumes a client keeps a fixed client_id, so the
+    # cache holds at most one entry per request class in practice.
+    _header_parts = {}
+
+    def encode_header(self, correlation_id, client_id):
+        """Encode the request header; same bytes as build_header().encode()"""
+        key = (self.__class__, client_id)
+        parts = Request._header_parts.get(key)
+        if parts is None:
+            header = self.build_header(correlation_id=0, client_id=client_id)
+            encoded = header.encode()
+            parts = Request._header_parts[key] = (encoded[:4], encoded[8:])
+        return b''.join((parts[0], Int32.encode(correlation_id), parts[1]))
+
 
 @add_metaclass(abc.ABCMeta)
 class Response(Struct):
@@ -108,7 +124,7 @@ class Response(Struct):
         pass
 
     def to_object(self):
-        return _to_object(self.SCHEMA, self)
+        return schema_to_object(self.SCHEMA, self)
 
     @classmethod
     def parse_header(cls, read_buffer):
@@ -117,7 +133,11 @@ class Response(Struct):
         return ResponseHeader.decode(read_buffer)
 
 
-def _to_object(schema, data):
+def schema_to_object(schema, data):
+    """Convert data decoded with schema (a Struct or tuple) into a dict.
+
+    Nested schemas become dicts and arrays of schemas become lists of dicts.
+    """
     obj = {}
     for idx, (name, _type) in enumerate(zip(schema.names, schema.fields)):
         if isinstance(data, Struct):
@@ -126,11 +146,11 @@ def _to_object(schema, data):
             val = data[idx]
 
         if isinstance(_type, Schema):
-            obj[name] = _to_object(_type, val)
+            obj[name] = schema_to_object(_type, val)
         elif isinstance(_type, Array):
             if isinstance(_type.array_of, (Array, Schema)):
                 obj[name] = [
-                    _to_object(_type.array_of, x)
+                    schema_to_object(_type.array_of, x)
                     for x in val
                 ]
             else:
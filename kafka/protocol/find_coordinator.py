@@ -1,7 +1,7 @@
 from __future__ import absolute_import
 
 from kafka.protocol.api import Request, Response
-from kafka.protocol.types import Int8, Int16, Int32, Schema, String
+from kafka.protocol.types import Int8, Int16, Int32, Schema, String, CompactString, CompactArray, TaggedFields
 
 
 class FindCoordinatorResponse_v0(Response):
@@ -34,6 +34,40 @@ class FindCoordinatorResponse_v2(Response):
     SCHEMA = FindCoordinatorResponse_v1.SCHEMA
 
 
+class FindCoordinatorResponse_v3(Response):
+    API_KEY = 10
+    API_VERSION = 3
+    SCHEMA = Schema(
+        ('throttle_time_ms', Int32),
+        ('error_code', Int16),
+        ('error_message', CompactString('utf-8')),
+        ('coordinator_id', Int32),
+        ('host', CompactString('utf-8')),
+        ('port', Int32),
+        ('tags', TaggedFields)
+    )
+    FLEXIBLE_VERSION = True
+
+
+class FindCoordinatorResponse_v4(Response):
+    API_KEY = 10
+    API_VERSION = 4
+    SCHEMA = Schema(
+        ('throttle_time_ms', Int32),
+        ('coordinators', CompactArray(
+            ('key', CompactString('utf-8')),
+            ('node_id', Int32),
+            ('host', CompactString('utf-8')),
+            ('port', Int32),
+            ('error_code', Int16),
+            ('error_message', CompactString('utf-8')),
+            ('tags', TaggedFields)
+        )),
+        ('tags', TaggedFields)
+    )
+    FLEXIBLE_VERSION = True
+
+
 class FindCoordinatorRequest_v0(Request):
     API_KEY = 10
     API_VERSION = 0
@@ -60,5 +94,36 @@ class FindCoordinatorRequest_v2(Request):
     SCHEMA = FindCoordinatorRequest_v1.SCHEMA
 
 
-FindCoordinatorRequest = [FindCoordinatorRequest_v0, FindCoordinatorRequest_v1, FindCoordinatorRequest_v2]
-FindCoordinatorResponse = [FindCoordinatorResponse_v0, FindCoordinatorResponse_v1, FindCoordinatorResponse_v2]
+class FindCoordinatorRequest_v3(Request):
+    FLEXIBLE_VERSION = True
+    API_KEY = 10
+    API_VERSION = 3
+    RESPONSE_TYPE = FindCoordinatorResponse_v3
+    SCHEMA = Schema(
+        ('coordinator_key', CompactString('utf-8')),
+        ('coordinator_type', Int8), # 0: consumer, 1: transaction
+        ('tags', TaggedFields)
+    )
+
+
+class FindCoordinatorRequest_v4(Request):
+    # Version 4 looks up the coordinators of many keys at once (KIP-699)
+    FLEXIBLE_VERSION = True
+    API_KEY = 10
+    API_VERSION = 4
+    RESPONSE_TYPE = FindCoordinatorResponse_v4
+    SCHEMA = Schema(
+        ('coordinator_type', Int8), # 0: consumer, 1: transaction
+        ('coordinator_keys', CompactArray(CompactString('utf-8'))),
+        ('tags', TaggedFields)
+    )
+
+
+FindCoordinatorRequest = [
+    FindCoordinatorRequest_v0, FindCoordinatorRequest_v1, FindCoordinatorRequest_v2,
+    FindCoordinatorRequest_v3, FindCoordinatorRequest_v4,
+]
+FindCoordinatorResponse = [
+    FindCoordinatorResponse_v0, FindCoordinatorResponse_v1, FindCoordinatorResponse_v2,
+    FindCoordinatorResponse_v3, FindCoordinatorResponse_v4,
+]
@@ -11,7 +11,7 @@ from kafka.protocol.struct import Struct
 from kafka.protocol.types import (
     Int8, Int32, Int64, Bytes, Schema, AbstractType
 )
-from kafka.util import crc32, WeakMethod
+from kafka.util import crc32
 
 
 class Message(Struct):
@@ -55,7 +55,6 @@ class Message(Struct):
         self.attributes = attributes
         self.key = key
         self.value = value
-        self.encode = WeakMethod(self._encode_self)
 
     @property
     def timestamp_type(self):
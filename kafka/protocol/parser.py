@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 import collections
+import io
 import logging
 
 import kafka.errors as Errors
@@ -59,11 +60,12 @@ class KafkaProtocol(object):
         if correlation_id is None:
             correlation_id = self._next_correlation_id()
 
-        header = request.build_header(correlation_id=correlation_id, client_id=self._client_id)
-        message = b''.join([header.encode(), request.encode()])
-        size = Int32.encode(len(message))
-        data = size + message
-        self.bytes_to_send.append(data)
+        encoded_header = request.encode_header(correlation_id, self._client_id)
+        encoded_request = request.encode()
+        # send_bytes() joins the queue anyway, so queue the size prefix and
+        # payload pieces as-is rather than copying them into one message here
+        size = Int32.encode(len(encoded_header) + len(encoded_request))
+        self.bytes_to_send.extend((size, encoded_header, encoded_request))
         if request.expect_response():
             ifr = (correlation_id, request)
             self.in_flight_requests.append(ifr)
@@ -126,8 +128,9 @@ class KafkaProtocol(object):
                     break
 
                 self._receiving = False
-                self._rbuffer.seek(0)
-                resp = self._process_response(self._rbuffer)
+                # Decoding issues many small reads; BytesIO serves them in C,
+                # which outweighs the single copy of the payload
+                resp = self._process_response(io.BytesIO(self._rbuffer))
                 responses.append(resp)
                 self._reset_buffer()
         return responses
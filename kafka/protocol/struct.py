@@ -5,7 +5,19 @@ from io import BytesIO
 from kafka.protocol.abstract import AbstractType
 from kafka.protocol.types import Schema
 
-from kafka.util import WeakMethod
+
+class _StructEncode(object):
+    """encode() on a Struct class encodes an item tuple; on an instance it
+    encodes the instance itself.
+
+    Resolving this on attribute access avoids storing a bound (weak) method
+    on every instance, which would otherwise be allocated for each decoded
+    response.
+    """
+    def __get__(self, obj, cls):
+        if obj is None:
+            return cls._encode_item
+        return obj._encode_self
 
 
 class Struct(AbstractType):
@@ -13,8 +25,9 @@ class Struct(AbstractType):
 
     def __init__(self, *args, **kwargs):
         if len(args) == len(self.SCHEMA.fields):
-            for i, name in enumerate(self.SCHEMA.names):
-                setattr(self, name, args[i])
+            # decode() builds every instance positionally; fill the instance
+            # dict in one step rather than a setattr() per field
+            self.__dict__.update(zip(self.SCHEMA.names, args))
         elif len(args) > 0:
             raise ValueError('Args must be empty or mirror schema')
         else:
@@ -25,13 +38,10 @@ class Struct(AbstractType):
                                  % (list(self.SCHEMA.names),
                                     ', '.join(kwargs.keys())))
 
-        # overloading encode() to support both class and instance
-        # Without WeakMethod() this creates circular ref, which
-        # causes instances to "leak" to garbage
-        self.encode = WeakMethod(self._encode_self)
+    encode = _StructEncode()
 
     @classmethod
-    def encode(cls, item):  # pylint: disable=E0202
+    def _encode_item(cls, item):
         bits = []
         for i, field in enumerate(cls.SCHEMA.fields):
             bits.append(field.encode(item[i]))
@@ -46,7 +56,7 @@ class Struct(AbstractType):
     def decode(cls, data):
         if isinstance(data, bytes):
             data = BytesIO(data)
-        return cls(*[field.decode(data) for field in cls.SCHEMA.fields])
+        return cls(*cls.SCHEMA.decode(data))
 
     def get_item(self, name):
         if name not in self.SCHEMA.names:
@@ -25,6 +25,24 @@ def _unpack(f, data):
                         .format(data, f, e))
 
 
+def _pack_run(packer, values):
+    try:
+        return packer.pack(*values)
+    except error as e:
+        raise ValueError("Error encountered when attempting to convert values: "
+                        "{!r} to struct format: '{}', hit error: {}"
+                        .format(values, packer.format, e))
+
+
+def _unpack_run(packer, data):
+    try:
+        return packer.unpack(data)
+    except error as e:
+        raise ValueError("Error encountered when attempting to convert value: "
+                        "{!r} to struct format: '{}', hit error: {}"
+                        .format(data, packer.format, e))
+
+
 class Int8(AbstractType):
     _pack = struct.Struct('>b').pack
     _unpack = struct.Struct('>b').unpack
@@ -91,6 +109,17 @@ class Float64(AbstractType):
 
 
 class String(AbstractType):
+    # Instances are stateless apart from their encoding, so schemas share
+    # one instance per (class, encoding) instead of allocating one per field
+    _instances = {}
+
+    def __new__(cls, encoding='utf-8'):
+        key = (cls, encoding)
+        instance = String._instances.get(key)
+        if instance is None:
+            instance = String._instances[key] = super(String, cls).__new__(cls)
+        return instance
+
     def __init__(self, encoding='utf-8'):
         self.encoding = encoding
 
@@ -146,23 +175,71 @@ class Boolean(AbstractType):
         return _unpack(cls._unpack, data.read(1))
 
 
+# struct format characters of the fixed-width types; consecutive fields of
+# these types in a Schema are packed and unpacked with a single struct call
+_FIXED_WIDTH_FORMATS = {
+    Int8: 'b',
+    Int16: 'h',
+    Int32: 'i',
+    Int64: 'q',
+    Float64: 'd',
+    Boolean: '?',
+}
+
+
 class Schema(AbstractType):
     def __init__(self, *fields):
         if fields:
             self.names, self.fields = zip(*fields)
         else:
             self.names, self.fields = (), ()
+        self._runs = self._compile_runs(self.fields)
+
+    @staticmethod
+    def _compile_runs(fields):
+        """Split fields into runs that can each be handled in one step.
+
+        Returns:
+            tuple of (start, end, packer, encode, decode): packer is a
+            struct.Struct covering fields[start:end] when that is a run of two
+            or more fixed-width fields, otherwise None and the run is the
+            single field at start, with its encode/decode methods pre-bound.
+        """
+        runs = []
+        start = 0
+        while start < len(fields):
+            end = start
+            while end < len(fields) and fields[end] in _FIXED_WIDTH_FORMATS:
+                end += 1
+            if end - start > 1:
+                fmt = '>' + ''.join(_FIXED_WIDTH_FORMATS[field] for field in fields[start:end])
+                runs.append((start, end, struct.Struct(fmt), None, None))
+            else:
+                end = start + 1
+                field = fields[start]
+                runs.append((start, end, None, field.encode, field.decode))
+            start = end
+        return tuple(runs)
 
     def encode(self, item):
         if len(item) != len(self.fields):
             raise ValueError('Item field count does not match Schema')
-        return b''.join([
-            field.encode(item[i])
-            for i, field in enumerate(self.fields)
-        ])
+        bits = []
+        for start, end, packer, encode, _ in self._runs:
+            if packer is None:
+                bits.append(encode(item[start]))
+            else:
+                bits.append(_pack_run(packer, item[start:end]))
+        return b''.join(bits)
 
     def decode(self, data):
-        return tuple([field.decode(data) for field in self.fields])
+        values = []
+        for _, _, packer, _, decode in self._runs:
+            if packer is None:
+                values.append(decode(data))
+            else:
+                values.extend(_unpack_run(packer, data.read(packer.size)))
+        return tuple(values)
 
     def __len__(self):
         return len(self.fields)
@@ -182,6 +259,12 @@ class Schema(AbstractType):
 
 
 class Array(AbstractType):
+    # {item format: {count: struct.Struct}} for fixed-width arrays of up to
+    # _MAX_CACHED_PACKER_COUNT items; longer arrays build their own Struct,
+    # which is cheap next to packing the items
+    _packers_by_format = {}
+    _MAX_CACHED_PACKER_COUNT = 64
+
     def __init__(self, *array_of):
         if len(array_of) > 1:
             self.array_of = Schema(*array_of)
@@ -190,21 +273,52 @@ class Array(AbstractType):
             self.array_of = array_of[0]
         else:
             raise ValueError('Array instantiated with no array_of type')
+        # Arrays of a fixed-width type are packed and unpacked in one struct call
+        self._item_format = _FIXED_WIDTH_FORMATS.get(self.array_of)
+        self._packers = Array._packers_by_format.setdefault(self._item_format, {})
+
+    def _build_packer(self, count):
+        packer = struct.Struct('>%d%s' % (count, self._item_format))
+        if count <= self._MAX_CACHED_PACKER_COUNT:
+            self._packers[count] = packer
+        return packer
+
+    def _encode_items(self, items):
+        if self._item_format is None:
+            return [self.array_of.encode(item) for item in items]
+        count = len(items)
+        if not count:
+            return []
+        packer = self._packers.get(count) or self._build_packer(count)
+        try:
+            return [packer.pack(*items)]
+        except error:
+            # repack through _pack_run for its descriptive ValueError
+            return [_pack_run(packer, items)]
+
+    def _decode_items(self, data, length):
+        if self._item_format is None:
+            return [self.array_of.decode(data) for _ in range(length)]
+        if length <= 0:
+            return []
+        packer = self._packers.get(length) or self._build_packer(length)
+        return list(_unpack_run(packer, data.read(packer.size)))
 
     def encode(self, items):
         if items is None:
             return Int32.encode(-1)
-        encoded_items = [self.array_of.encode(item) for item in items]
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
         return b''.join(
-            [Int32.encode(len(encoded_items))] +
-            encoded_items
+            [Int32.encode(len(items))] +
+            self._encode_items(items)
         )
 
     def decode(self, data):
         length = Int32.decode(data)
         if length == -1:
             return None
-        return [self.array_of.decode(data) for _ in range(length)]
+        return self._decode_items(data, length)
 
     def repr(self, list_of_items):
         if list_of_items is None:
@@ -213,11 +327,19 @@ class Array(AbstractType):
 
 
 class UnsignedVarInt32(AbstractType):
+    # Lengths, counts and tags in flexible versions almost always fit in a
+    # single byte, so those are decoded and encoded without the varint loop
+    _unpack_byte = struct.Struct('B').unpack
+    _single_bytes = tuple(struct.pack('B', b) for b in range(0x80))
+
     @classmethod
     def decode(cls, data):
-        value, i = 0, 0
+        b, = cls._unpack_byte(data.read(1))
+        if not (b & 0x80):
+            return b
+        value, i = b & 0x7f, 7
         while True:
-            b, = struct.unpack('B', data.read(1))
+            b, = cls._unpack_byte(data.read(1))
             if not (b & 0x80):
                 break
             value |= (b & 0x7f) << i
@@ -230,6 +352,8 @@ class UnsignedVarInt32(AbstractType):
     @classmethod
     def encode(cls, value):
         value &= 0xffffffff
+        if value < 0x80:
+            return cls._single_bytes[value]
         ret = b''
         while (value & 0xffffff80) != 0:
             b = (value & 0x7f) | 0x80
@@ -352,16 +476,18 @@ class CompactArray(Array):
     def encode(self, items):
         if items is None:
             return UnsignedVarInt32.encode(0)
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
         return b''.join(
             [UnsignedVarInt32.encode(len(items) + 1)] +
-            [self.array_of.encode(item) for item in items]
+            self._encode_items(items)
         )
 
     def decode(self, data):
         length = UnsignedVarInt32.decode(data) - 1
         if length == -1:
             return None
-        return [self.array_of.decode(data) for _ in range(length)]
+        return self._decode_items(data, length)
 
 
 class BitField(AbstractType):
@@ -386,11 +512,11 @@ class BitField(AbstractType):
 
     @classmethod
     def from_32_bit_field(cls, value):
+        # visit only the set bits rather than shifting through all 32
         result = set()
-        count = 0
-        while value != 0:
-            if (value & 1) != 0:
-                result.add(count)
-            count += 1
-            value = (value & 0xFFFFFFFF) >> 1
+        value &= 0xFFFFFFFF
+        while value:
+            lowest = value & -value
+            result.add(lowest.bit_length() - 1)
+            value ^= lowest
         return result
@@ -1,7 +1,9 @@
 import pytest
 
 import kafka.admin
-from kafka.errors import IllegalArgumentError
+from kafka.errors import IllegalArgumentError, KafkaConnectionError, NoError, UnknownTopicOrPartitionError
+from kafka.future import Future
+from kafka.structs import GroupInformation, MemberInformation
 
 
 def test_config_resource():
@@ -92,3 +94,423 @@ def test_new_topic():
     assert good_topic.replication_factor == -1
     assert good_topic.replica_assignments == {1: [1, 2, 3]}
     assert good_topic.topic_configs == {'key': 'value'}
+
+
+@pytest.fixture
+def admin_client(mocker):
+    # Bypass __init__ so no bootstrap / controller lookup is attempted
+    admin = kafka.admin.KafkaAdminClient.__new__(kafka.admin.KafkaAdminClient)
+    admin._client = mocker.MagicMock()
+    admin._api_version_cache = {}
+    admin._node_version_cache = {}
+    return admin
+
+
+def test_wait_for_futures_single_poll(admin_client):
+    futures = [Future(), Future(), Future()]
+
+    def poll(timeout_ms=None, future=None):
+        for f in futures:
+            if not f.is_done:
+                f.success(True)
+    admin_client._client.poll.side_effect = poll
+
+    admin_client._wait_for_futures(futures)
+    assert admin_client._client.poll.call_count == 1
+    assert all(f.succeeded() for f in futures)
+
+
+def test_wait_for_futures_raises_failure(admin_client):
+    futures = [Future(), Future()]
+
+    def poll(timeout_ms=None, future=None):
+        futures[0].success(True)
+        futures[1].failure(UnknownTopicOrPartitionError)
+    admin_client._client.poll.side_effect = poll
+
+    with pytest.raises(UnknownTopicOrPartitionError):
+        admin_client._wait_for_futures(futures)
+
+
+@pytest.fixture
+def ready_nodes(admin_client):
+    """Node ids the mocked KafkaClient reports as ready; await_ready() makes a node ready"""
+    ready = set()
+    client = admin_client._client
+    client.is_ready.side_effect = lambda node_id: node_id in ready
+    client.await_ready.side_effect = ready.add
+    client.send.side_effect = lambda node_id, request, *args: Future().success((node_id, request))
+    return ready
+
+
+def _client_calls(admin_client, *names):
+    return [(name, args) for name, args, _ in admin_client._client.mock_calls if name in names]
+
+
+def test_send_requests_connects_cold_nodes_once(admin_client, ready_nodes):
+    ready_nodes.add(0)
+    requests = [('a', 1), ('b', 2), ('c', 1), ('d', 0)]
+    assert admin_client.send_requests(requests) == [(1, 'a'), (2, 'b'), (1, 'c'), (0, 'd')]
+
+    client = admin_client._client
+    assert sorted(c[0][0] for c in client.maybe_connect.call_args_list) == [1, 2]
+    assert [c[0][0] for c in client.await_ready.call_args_list] == [1, 2]
+    # every connection is initiated before blocking on the first one
+    calls = [name for name, _ in _client_calls(admin_client, 'maybe_connect', 'await_ready', 'send')]
+    assert calls == ['maybe_connect', 'maybe_connect', 'await_ready', 'send', 'await_ready', 'send', 'send', 'send']
+
+
+def test_send_requests_resolves_unknown_node_per_request(admin_client, ready_nodes):
+    ready_nodes.update([1, 2])
+    admin_client._client.least_loaded_node.side_effect = [1, 2]
+    assert admin_client.send_requests([('a', None), ('b', None)]) == [(1, 'a'), (2, 'b')]
+
+    admin_client._client.maybe_connect.assert_not_called()
+    # the second lookup happens once the first request is in flight
+    assert _client_calls(admin_client, 'least_loaded_node', 'send') == [
+        ('least_loaded_node', ()), ('send', (1, 'a')),
+        ('least_loaded_node', ()), ('send', (2, 'b')),
+    ]
+
+
+def test_send_request_awaits_only_cold_nodes(admin_client, ready_nodes):
+    ready_nodes.add(1)
+    assert admin_client.send_request('a', node_id=1) == (1, 'a')
+    admin_client._client.await_ready.assert_not_called()
+
+    assert admin_client.send_request('b', node_id=2) == (2, 'b')
+    assert _client_calls(admin_client, 'await_ready', 'send') == [
+        ('send', (1, 'a')), ('await_ready', (2,)), ('send', (2, 'b')),
+    ]
+    admin_client._client.poll.assert_not_called()
+
+
+def test_send_request_to_node_connection_error(admin_client, ready_nodes):
+    admin_client._client.await_ready.side_effect = KafkaConnectionError('down')
+    future = admin_client._send_request_to_node(1, 'a')
+    assert future.failed()
+    assert isinstance(future.exception, KafkaConnectionError)
+    admin_client._client.send.assert_not_called()
+
+
+def test_send_request_polls_single_future(admin_client, ready_nodes):
+    ready_nodes.add(1)
+    future = Future()
+    admin_client._client.send.side_effect = None
+    admin_client._client.send.return_value = future
+    admin_client._client.poll.side_effect = lambda future=None, timeout_ms=None: future.success('done')
+    assert admin_client.send_request('a', node_id=1) == 'done'
+    admin_client._client.poll.assert_called_once_with(future=future)
+
+    future = Future()
+    admin_client._client.send.return_value = future
+    admin_client._client.poll.side_effect = lambda future=None, timeout_ms=None: future.failure(UnknownTopicOrPartitionError)
+    with pytest.raises(UnknownTopicOrPartitionError):
+        admin_client.send_request('b', node_id=1)
+
+
+def test_api_version_cached(admin_client):
+    from kafka.protocol.metadata import MetadataRequest
+    admin_client._client.api_version.return_value = 8
+    assert admin_client._api_version(MetadataRequest, max_version=8) == 8
+    assert admin_client._api_version(MetadataRequest, max_version=8) == 8
+    assert admin_client._client.api_version.call_count == 1
+
+
+def test_valid_acl_operation_names():
+    from kafka.admin.acl_resource import ACLOperation, valid_acl_operations, valid_acl_operation_names
+    ops = set(range(0, 14))
+    assert sorted(valid_acl_operation_names(ops)) == sorted(op.name for op in valid_acl_operations(ops))
+    assert not set(valid_acl_operation_names(ops)) & {'UNKNOWN', 'ANY', 'ALL'}
+    # aliased values resolve to the canonical member, as ACLOperation(13) does
+    assert valid_acl_operation_names([13]) == [ACLOperation(13).name]
+    with pytest.raises(ValueError):
+        valid_acl_operation_names({3, 31})
+
+
+def test_process_metadata_response(admin_client):
+    from kafka.protocol.metadata import MetadataResponse
+    response = MetadataResponse[8](
+        0, [(0, 'host', 9092, None)], 'cluster', 0,
+        [(0, 'topic', False, [(0, 0, 0, 0, [0], [0], [])], {3})],
+        {4})
+    metadata = admin_client._process_metadata_response(response)
+    assert metadata['authorized_operations'] == ['WRITE']
+    assert metadata['brokers'] == [{'node_id': 0, 'host': 'host', 'port': 9092, 'rack': None}]
+    assert metadata['topics'][0]['topic'] == 'topic'
+    assert metadata['topics'][0]['authorized_operations'] == ['READ']
+    assert metadata['topics'][0]['partitions'][0]['leader'] == 0
+
+    cluster = admin_client._process_metadata_response(response, include_topics=False)
+    assert 'topics' not in cluster
+    assert cluster['cluster_id'] == 'cluster'
+
+
+@pytest.mark.parametrize('version', [0, 1, 8])
+def test_list_topics(admin_client, mocker, version):
+    from kafka.protocol.metadata import MetadataResponse
+    topics = [(0, 'foo', False, [], 0), (3, 'bar', False, [], 0)]
+    if version == 0:
+        response = MetadataResponse[0]([], [(0, 'foo', []), (3, 'bar', [])])
+    elif version == 1:
+        response = MetadataResponse[1]([], 0, [t[:4] for t in topics])
+    else:
+        response = MetadataResponse[8](0, [], 'cluster', 0, topics, 0)
+    mocker.patch.object(admin_client, '_send_metadata_request', return_value=response)
+    assert admin_client.list_topics() == ['foo', 'bar']
+
+
+def test_convert_describe_acls_response_to_acls():
+    from kafka.protocol.admin import DescribeAclsResponse
+    convert = kafka.admin.KafkaAdminClient._convert_describe_acls_response_to_acls
+    for response, pattern_type in (
+            (DescribeAclsResponse[0](0, 0, None, [(2, 'foo', [('User:bar', '*', 3, 3)])]),
+             kafka.admin.ACLResourcePatternType.LITERAL),
+            (DescribeAclsResponse[1](0, 0, None, [(2, 'foo', 4, [('User:bar', '*', 3, 3)])]),
+             kafka.admin.ACLResourcePatternType.PREFIXED)):
+        acls, error = convert(response)
+        assert error is NoError
+        assert len(acls) == 1
+        assert acls[0].principal == 'User:bar'
+        assert acls[0].operation == kafka.admin.ACLOperation.READ
+        assert acls[0].permission_type == kafka.admin.ACLPermissionType.ALLOW
+        assert acls[0].resource_pattern.resource_type == kafka.admin.ResourceType.TOPIC
+        assert acls[0].resource_pattern.pattern_type == pattern_type
+
+
+def test_convert_create_acls_response_to_acls():
+    from kafka.errors import KafkaProtocolError, SecurityDisabledError
+    from kafka.protocol.admin import CreateAclsResponse
+    convert = kafka.admin.KafkaAdminClient._convert_create_acls_response_to_acls
+    acls = [
+        kafka.admin.ACL('User:%s' % name, '*', kafka.admin.ACLOperation.READ, kafka.admin.ACLPermissionType.ALLOW,
+                        kafka.admin.ResourcePattern(kafka.admin.ResourceType.TOPIC, 'foo'))
+        for name in ('a', 'b')
+    ]
+    result = convert(acls, CreateAclsResponse[1](0, [(0, None), (SecurityDisabledError.errno, 'disabled')]))
+    assert result['succeeded'] == [acls[0]]
+    assert result['failed'] == [(acls[1], SecurityDisabledError)]
+
+    # a short (or long) response must not silently drop ACLs
+    with pytest.raises(KafkaProtocolError):
+        convert(acls, CreateAclsResponse[1](0, [(0, None)]))
+    with pytest.raises(KafkaProtocolError):
+        convert(acls[:1], CreateAclsResponse[1](0, [(0, None), (0, None)]))
+
+
+@pytest.mark.parametrize('version', [0, 1])
+def test_describe_acls_request(admin_client, mocker, version):
+    from kafka.protocol.admin import DescribeAclsResponse
+    admin_client._client.api_version.return_value = version
+    send_request = mocker.patch.object(
+        admin_client, 'send_request',
+        return_value=DescribeAclsResponse[version](0, 0, None, []))
+    acl_filter = kafka.admin.ACLFilter(
+        "User:bar", "*", kafka.admin.ACLOperation.ANY, kafka.admin.ACLPermissionType.ANY,
+        kafka.admin.ResourcePatternFilter(
+            kafka.admin.ResourceType.TOPIC, "foo", kafka.admin.ACLResourcePatternType.LITERAL))
+    assert admin_client.describe_acls(acl_filter) == ([], NoError)
+    request = send_request.call_args[0][0]
+    assert request.API_VERSION == version
+    assert request.resource_name == "foo"
+    assert request.principal == "User:bar"
+    assert request.operation == kafka.admin.ACLOperation.ANY
+    if version > 0:
+        assert request.resource_pattern_type_filter == kafka.admin.ACLResourcePatternType.LITERAL
+
+
+def test_create_partitions_request(admin_client, mocker):
+    admin_client.config = {'request_timeout_ms': 1000}
+    admin_client._client.api_version.return_value = 1
+    send = mocker.patch.object(admin_client, '_send_request_to_controller')
+    admin_client.create_partitions({'foo': kafka.admin.NewPartitions(7, [[1, 2, 3]])})
+    request = send.call_args[0][0]
+    assert request.topic_partitions == [('foo', (7, [[1, 2, 3]]))]
+    request.encode()
+
+
+def test_describe_configs_splits_broker_resources(admin_client, mocker):
+    admin_client._client.api_version.return_value = 1
+    send = mocker.patch.object(admin_client, 'send_requests')
+    admin_client.describe_configs([
+        kafka.admin.ConfigResource('broker', '1'),
+        kafka.admin.ConfigResource('topic', 'foo', {'retention.ms': None}),
+        kafka.admin.ConfigResource('topic', 'bar'),
+    ])
+    (broker_request, broker_id), (topic_request, node_id) = send.call_args[0][0]
+    assert broker_id == 1
+    assert broker_request.resources == [(kafka.admin.ConfigResourceType.BROKER, '1', None)]
+    assert node_id is None
+    assert topic_request.resources == [
+        (kafka.admin.ConfigResourceType.TOPIC, 'foo', ['retention.ms']),
+        (kafka.admin.ConfigResourceType.TOPIC, 'bar', None),
+    ]
+
+
+def test_find_coordinator_ids_batch(admin_client, mocker):
+    from kafka.errors import CoordinatorNotAvailableError
+    from kafka.protocol.find_coordinator import FindCoordinatorResponse
+    admin_client._client.api_version.return_value = 4
+    send_request = mocker.patch.object(
+        admin_client, 'send_request',
+        return_value=FindCoordinatorResponse[4](0, [
+            ('foo', 1, 'host1', 9092, 0, None, {}),
+            ('bar', 2, 'host2', 9092, 0, None, {}),
+        ], {}))
+    assert admin_client._find_coordinator_ids(['foo', 'bar']) == {'foo': 1, 'bar': 2}
+    assert send_request.call_count == 1
+    assert send_request.call_args[0][0].coordinator_keys == ['foo', 'bar']
+
+    send_request.return_value = FindCoordinatorResponse[4](0, [
+        ('foo', -1, '', -1, CoordinatorNotAvailableError.errno, None, {})], {})
+    with pytest.raises(CoordinatorNotAvailableError):
+        admin_client._find_coordinator_ids(['foo'])
+
+    # a group left out of the response is an error, not a silent omission
+    send_request.return_value = FindCoordinatorResponse[4](0, [
+        ('foo', 1, 'host1', 9092, 0, None, {})], {})
+    with pytest.raises(CoordinatorNotAvailableError, match='bar'):
+        admin_client._find_coordinator_ids(['foo', 'bar'])
+
+    send_request.reset_mock()
+    assert admin_client._find_coordinator_ids([]) == {}
+    send_request.assert_not_called()
+
+
+def test_find_coordinator_ids_per_group_fallback(admin_client, mocker):
+    from kafka.errors import GroupAuthorizationFailedError
+    from kafka.protocol.find_coordinator import FindCoordinatorResponse
+    # broker supports FindCoordinator up to v3, so no batched lookups
+    admin_client._client.api_version.side_effect = lambda operation, max_version=None: min(3, max_version)
+    send_requests = mocker.patch.object(admin_client, 'send_requests', return_value=[1, 2])
+    assert admin_client._find_coordinator_ids(['foo', 'bar']) == {'foo': 1, 'bar': 2}
+    requests = list(send_requests.call_args[0][0])
+    assert [(request.API_VERSION, request.coordinator_key, node_id) for request, node_id in requests] == [
+        (2, 'foo', None), (2, 'bar', None)]
+
+    # each group's response is checked by the single-group response handler
+    process = send_requests.call_args[1]['response_fn']
+    assert process(FindCoordinatorResponse[2](0, 0, None, 2, 'host2', 9092)) == 2
+    with pytest.raises(GroupAuthorizationFailedError):
+        process(FindCoordinatorResponse[2](0, GroupAuthorizationFailedError.errno, None, -1, '', -1))
+
+
+def test_list_consumer_group_offsets_request(admin_client):
+    from kafka.structs import TopicPartition
+    admin_client._client.api_version.return_value = 5
+    request = admin_client._list_consumer_group_offsets_request('group', [
+        TopicPartition('t', 2), TopicPartition('t', 1), TopicPartition('u', 0), TopicPartition('t', 2)])
+    assert sorted(request.topics) == [('t', [2, 1]), ('u', [0])]
+
+
+def test_list_consumer_group_offsets_process_response(admin_client):
+    from kafka.protocol.commit import OffsetFetchResponse
+    from kafka.structs import OffsetAndMetadata, TopicPartition
+    response = OffsetFetchResponse[1]([('t', [(0, 10, '', 0)])])
+    assert admin_client._list_consumer_group_offsets_process_response(response) == {
+        TopicPartition('t', 0): OffsetAndMetadata(10, '', -1)}
+    response = OffsetFetchResponse[5](0, [('t', [(0, 10, 3, 'meta', 0)])], 0)
+    assert admin_client._list_consumer_group_offsets_process_response(response) == {
+        TopicPartition('t', 0): OffsetAndMetadata(10, 'meta', 3)}
+    response = OffsetFetchResponse[5](0, [('t', [(0, -1, -1, '', UnknownTopicOrPartitionError.errno)])], 0)
+    with pytest.raises(UnknownTopicOrPartitionError):
+        admin_client._list_consumer_group_offsets_process_response(response)
+
+
+def test_list_consumer_group_offsets_batch(admin_client, mocker):
+    from kafka.protocol.commit import OffsetFetchResponse
+    from kafka.structs import OffsetAndMetadata, TopicPartition
+    admin_client._client.api_version.return_value = 3
+    mocker.patch.object(admin_client, '_find_coordinator_ids',
+                        return_value={'g1': 1, 'g2': 2})
+    send_requests = mocker.patch.object(
+        admin_client, 'send_requests',
+        side_effect=lambda requests, response_fn: [
+            response_fn(OffsetFetchResponse[3](0, [('t', [(0, node_id * 10, '', 0)])], 0))
+            for _request, node_id in requests])
+    assert admin_client.list_consumer_group_offsets_batch(['g1', 'g2']) == {
+        'g1': {TopicPartition('t', 0): OffsetAndMetadata(10, '', -1)},
+        'g2': {TopicPartition('t', 0): OffsetAndMetadata(20, '', -1)},
+    }
+    requests = send_requests.call_args[0][0]
+    assert [(request.consumer_group, node_id) for request, node_id in requests] == [('g1', 1), ('g2', 2)]
+
+
+def test_refresh_controller_id_caches_controller_version(admin_client, mocker):
+    from kafka.protocol.metadata import MetadataResponse
+    admin_client.config = {'retry_backoff_ms': 100}
+    admin_client._client.api_version.return_value = 1
+    admin_client._client.check_version.return_value = (2, 0)
+    mocker.patch.object(admin_client, 'send_request',
+                        return_value=MetadataResponse[1]([], 3, []))
+    admin_client._refresh_controller_id()
+    admin_client._refresh_controller_id()
+    assert admin_client._controller_id == 3
+    admin_client._client.check_version.assert_called_once_with(node_id=3)
+
+    # a metadata update may follow a broker upgrade, so the version is probed again
+    admin_client._handle_metadata_update(admin_client._client.cluster)
+    admin_client._refresh_controller_id()
+    assert admin_client._client.check_version.call_count == 2
+
+
+def test_get_leader_for_partitions(admin_client, mocker):
+    from kafka.structs import TopicPartition
+    admin_client.config = {'request_timeout_ms': 30000}
+    mocker.patch.object(admin_client, '_get_cluster_metadata', return_value={
+        'topics': [
+            {'topic': 'foo', 'partitions': [
+                {'partition': 0, 'leader': 1},
+                {'partition': 1, 'leader': 2},
+                {'partition': 2, 'leader': 1}]},
+        ]})
+    leaders = admin_client._get_leader_for_partitions(
+        [TopicPartition('foo', 0), TopicPartition('foo', 1), TopicPartition('foo', 2)])
+    assert dict(leaders) == {
+        1: [TopicPartition('foo', 0), TopicPartition('foo', 2)],
+        2: [TopicPartition('foo', 1)]}
+
+    with pytest.raises(UnknownTopicOrPartitionError):
+        admin_client._get_leader_for_partitions([TopicPartition('foo', 0), TopicPartition('bar', 0)])
+
+
+@pytest.mark.parametrize('version', [0, 1, 2, 3])
+def test_describe_consumer_groups_process_response(admin_client, version):
+    from kafka.coordinator.protocol import ConsumerProtocolMemberMetadata_v0, ConsumerProtocolMemberAssignment_v0
+    from kafka.protocol.admin import DescribeGroupsResponse
+    metadata = ConsumerProtocolMemberMetadata_v0(0, ['foo'], b'')
+    assignment = ConsumerProtocolMemberAssignment_v0(0, [('foo', [0, 1])], b'')
+    group = (0, 'group', 'Stable', 'consumer', 'range',
+             [('member', 'client', '/127.0.0.1', metadata.encode(), assignment.encode())])
+    if version >= 3:
+        group += ({3, 8},)
+    response = DescribeGroupsResponse[version](*((0,) if version else ()) + ([group],))
+
+    description = admin_client._describe_consumer_groups_process_response(response)
+    assert isinstance(description, GroupInformation)
+    assert description.group == 'group'
+    assert description.protocol_type == 'consumer'
+    assert description.members == [MemberInformation('member', 'client', '/127.0.0.1', metadata, assignment)]
+    if version >= 3:
+        assert sorted(description.authorized_operations) == ['DESCRIBE', 'READ']
+    else:
+        assert description.authorized_operations == []
+
+
+def test_delete_records(admin_client, mocker):
+    from kafka.protocol.admin import DeleteRecordsResponse
+    from kafka.structs import TopicPartition
+    admin_client.config = {'request_timeout_ms': 30000}
+    admin_client._client.api_version.return_value = 0
+    records = {TopicPartition('foo', 0): 10, TopicPartition('bar', 0): 20, TopicPartition('foo', 1): 30}
+    mocker.patch.object(admin_client, '_get_leader_for_partitions',
+                        return_value={1: list(records)})
+    send_request = mocker.patch.object(admin_client, 'send_request', return_value=DeleteRecordsResponse[0](
+        0, [('bar', [(0, 20, 0)]), ('foo', [(0, 10, 0), (1, 30, 0)])]))
+
+    result = admin_client.delete_records(records)
+    request = send_request.call_args[0][0]
+    assert sorted((topic, sorted(partitions)) for topic, partitions in request.topics) == [
+        ('bar', [(0, 20)]), ('foo', [(0, 10), (1, 30)])]
+    assert result[TopicPartition('foo', 1)] == {'partition_index': 1, 'low_watermark': 30, 'error_code': 0}
+    assert set(result) == set(records)
@@ -54,6 +54,52 @@ def test_assignor_roundrobin(mocker):
         assert ret[member].encode() == expected[member].encode()
 
 
+def test_assignor_roundrobin_unequal_subscriptions(mocker):
+    assignor = RoundRobinPartitionAssignor
+
+    group_subscriptions = {
+        'C0': Subscription(assignor.metadata({'t0'}), None),
+        'C1': Subscription(assignor.metadata({'t0', 't1'}), None),
+        'C2': Subscription(assignor.metadata({'t0', 't1', 't2'}), None),
+    }
+
+    partitions = {'t0': {0}, 't1': {0, 1}, 't2': {0, 1, 2}}
+    cluster = create_cluster(mocker, set(partitions), topic_partitions_lambda=partitions.get)
+    ret = assignor.assign(cluster, group_subscriptions)
+    expected = {
+        'C0': ConsumerProtocolMemberAssignment_v0(
+            assignor.version, [('t0', [0])], b''),
+        'C1': ConsumerProtocolMemberAssignment_v0(
+            assignor.version, [('t1', [0])], b''),
+        'C2': ConsumerProtocolMemberAssignment_v0(
+            assignor.version, [('t1', [1]), ('t2', [0, 1, 2])], b''),
+    }
+    assert ret == expected
+
+
+def test_assignor_roundrobin_static_members(mocker):
+    assignor = RoundRobinPartitionAssignor
+
+    # static and dynamic members interleaved in iteration order
+    group_subscriptions = {
+        'C0': Subscription(assignor.metadata({'t0'}), 'static-a'),
+        'C1': Subscription(assignor.metadata({'t0'}), None),
+        'C2': Subscription(assignor.metadata({'t0'}), 'static-b'),
+    }
+
+    cluster = create_cluster(mocker, {'t0'}, topics_partitions={0, 1, 2})
+    ret = assignor.assign(cluster, group_subscriptions)
+    expected = {
+        'C0': ConsumerProtocolMemberAssignment_v0(
+            assignor.version, [('t0', [0])], b''),
+        'C1': ConsumerProtocolMemberAssignment_v0(
+            assignor.version, [('t0', [2])], b''),
+        'C2': ConsumerProtocolMemberAssignment_v0(
+            assignor.version, [('t0', [1])], b''),
+    }
+    assert ret == expected
+
+
 def test_assignor_range(mocker):
     assignor = RangePartitionAssignor
 
@@ -6,10 +6,10 @@ import pytest
 
 from kafka.protocol.api import RequestHeader
 from kafka.protocol.fetch import FetchRequest, FetchResponse
-from kafka.protocol.find_coordinator import FindCoordinatorRequest
+from kafka.protocol.find_coordinator import FindCoordinatorRequest, FindCoordinatorResponse
 from kafka.protocol.message import Message, MessageSet, PartialMessage
 from kafka.protocol.metadata import MetadataRequest
-from kafka.protocol.types import Int16, Int32, Int64, String, UnsignedVarInt32, CompactString, CompactArray, CompactBytes, BitField
+from kafka.protocol.types import Int8, Int16, Int32, Int64, String, UnsignedVarInt32, CompactString, CompactArray, CompactBytes, BitField, Boolean, Schema, Array
 
 
 def test_create_message():
@@ -173,6 +173,32 @@ def test_encode_message_header():
     assert header.encode() == expect
 
 
+@pytest.mark.parametrize(('req',), [
+    (FindCoordinatorRequest[0]('foo'),),
+    (FindCoordinatorRequest[4](coordinator_type=0, coordinator_keys=['foo'], tags={}),),
+])
+def test_encode_header_matches_build_header(req):
+    for correlation_id in (0, 4, 2**31 - 1):
+        for client_id in ('client3', 'other-client'):
+            header = req.build_header(correlation_id=correlation_id, client_id=client_id)
+            assert req.encode_header(correlation_id, client_id) == header.encode()
+
+
+def test_find_coordinator_batch_serde():
+    req = FindCoordinatorRequest[4](coordinator_type=0, coordinator_keys=['foo', 'bar'], tags={})
+    assert req.encode() == b''.join([
+        struct.pack('>b', 0),           # coordinator_type
+        struct.pack('B', 3),            # compact array length + 1
+        struct.pack('B', 4), b'foo',    # compact string length + 1
+        struct.pack('B', 4), b'bar',
+        struct.pack('B', 0),            # tagged fields
+    ])
+
+    resp = FindCoordinatorResponse[4](0, [('foo', 1, 'host', 9092, 0, None, {})], {})
+    decoded = FindCoordinatorResponse[4].decode(io.BytesIO(resp.encode()))
+    assert decoded.coordinators == [('foo', 1, 'host', 9092, 0, None, {})]
+
+
 def test_decode_message_set_partial():
     encoded = b''.join([
         struct.pack('>q', 0),          # Msg Offset
@@ -284,6 +310,62 @@ def test_struct_missing_kwargs():
     assert fr.min_bytes is None
 
 
+def test_schema_fixed_width_runs():
+    schema = Schema(
+        ('a', Int16),
+        ('b', Int32),
+        ('c', String('utf-8')),
+        ('d', Int64),
+        ('e', Int8),
+        ('f', Boolean),
+        ('g', Int32),
+    )
+    item = (1, -2, 'foo', 3, 4, True, 5)
+    encoded = schema.encode(item)
+    assert encoded == b''.join([
+        struct.pack('>hi', 1, -2),
+        struct.pack('>h', 3), b'foo',
+        struct.pack('>qb?i', 3, 4, True, 5),
+    ])
+    assert schema.decode(io.BytesIO(encoded)) == item
+
+    with pytest.raises(ValueError):
+        schema.encode((1, 2 ** 40, 'foo', 3, 4, True, 5))
+    with pytest.raises(ValueError):
+        schema.decode(io.BytesIO(encoded[:-2]))
+
+
+def test_string_instances_shared():
+    assert String('utf-8') is String('utf-8')
+    assert CompactString('utf-8') is CompactString('utf-8')
+    assert CompactString('utf-8') is not String('utf-8')
+    assert String('latin-1').encoding == 'latin-1'
+    assert String('utf-8').encoding == 'utf-8'
+
+
+@pytest.mark.parametrize(('array_type', 'item_type', 'fmt'), [
+    (Array, Int32, '>i'),
+    (Array, Int64, '>q'),
+    (CompactArray, Int16, '>h'),
+])
+def test_fixed_width_array_serde(array_type, item_type, fmt):
+    arr = array_type(item_type)
+    items = [0, 1, -1, 32767, -32768]
+    encoded = arr.encode(items)
+    assert encoded.endswith(b''.join(struct.pack(fmt, x) for x in items))
+    assert arr.decode(io.BytesIO(encoded)) == items
+    assert arr.decode(io.BytesIO(arr.encode([]))) == []
+    assert arr.decode(io.BytesIO(arr.encode(None))) is None
+    assert arr.encode(set([1])) == arr.encode([1])
+    # longer than the cached packers
+    long_items = list(range(100))
+    assert arr.decode(io.BytesIO(arr.encode(long_items))) == long_items
+    with pytest.raises(ValueError):
+        arr.decode(io.BytesIO(encoded[:-1]))
+    with pytest.raises(ValueError):
+        arr.encode([2 ** 64])
+
+
 def test_unsigned_varint_serde():
     pairs = {
         0: [0],
@@ -342,3 +424,14 @@ def test_compact_data_structs():
 ])
 def test_bit_field(test_set):
     assert BitField.decode(io.BytesIO(BitField.encode(test_set))) == test_set
+
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    (0, set()),
+    (0b10010, set([1, 4])),
+    (-2147483648, set([31])),
+    (-1, set(range(32))),
+])
+def test_bit_field_from_32_bit_field(value, expected):
+    assert BitField.from_32_bit_field(value) == expected
+    assert BitField.decode(io.BytesIO(Int32.encode(value))) == expected